@@ -326,14 +326,10 @@ class MaynordApp(QMainWindow):
     def _menu_export_pdf(self):
         """Export from menu - uses current calculator state"""
         if self.calculator_tab.last_result:
-            import tempfile
-            import os
-            temp_chart = os.path.join(tempfile.gettempdir(), 'maynord_chart.png')
-            self.calculator_tab.save_chart_image(temp_chart)
             self.export_pdf(
                 self.calculator_tab.last_result,
                 self.calculator_tab.get_input_params(),
-                temp_chart
+                self.calculator_tab.get_chart_image()
             )
         else:
             QMessageBox.warning(self, "Export", "Effectuez d'abord un calcul.")
@@ -667,8 +663,26 @@ QFrame#resultCard:hover {
     border-color: #2563eb;
     background: #f8fafc;
 }
+QFrame#resultCard QLabel#resultTitle {
+    font-size: 11px;
+    font-weight: bold;
+}
+QFrame#resultCard[accent="blue"] QLabel#resultTitle { color: #2563eb; }
+QFrame#resultCard[accent="green"] QLabel#resultTitle { color: #16a34a; }
+QFrame#resultCard[accent="red"] QLabel#resultTitle { color: #dc2626; }
+QFrame#resultCard[accent="amber"] QLabel#resultTitle { color: #f59e0b; }
+QFrame#resultCard[accent="purple"] QLabel#resultTitle { color: #8b5cf6; }
+QFrame#resultCard[accent="gray"] QLabel#resultTitle { color: #64748b; }
+QFrame#resultCard[accent="sky"] QLabel#resultTitle { color: #0ea5e9; }
 QLabel#resultValue {
     color: #1e293b;
+    font-family: 'Consolas', 'Monaco', monospace;
+    font-size: 20px;
+    font-weight: bold;
+}
+QLabel#resultUnit {
+    color: #64748b;
+    font-size: 10px;
 }
 QFrame#warningsFrame {
     background: #fef3c7;
@@ -982,8 +996,26 @@ QFrame#resultCard:hover {
     border-color: #0ea5e9;
     background: #293548;
 }
+QFrame#resultCard QLabel#resultTitle {
+    font-size: 11px;
+    font-weight: bold;
+}
+QFrame#resultCard[accent="blue"] QLabel#resultTitle { color: #2563eb; }
+QFrame#resultCard[accent="green"] QLabel#resultTitle { color: #16a34a; }
+QFrame#resultCard[accent="red"] QLabel#resultTitle { color: #dc2626; }
+QFrame#resultCard[accent="amber"] QLabel#resultTitle { color: #f59e0b; }
+QFrame#resultCard[accent="purple"] QLabel#resultTitle { color: #8b5cf6; }
+QFrame#resultCard[accent="gray"] QLabel#resultTitle { color: #64748b; }
+QFrame#resultCard[accent="sky"] QLabel#resultTitle { color: #0ea5e9; }
 QLabel#resultValue {
     color: #e2e8f0;
+    font-family: 'Consolas', 'Monaco', monospace;
+    font-size: 20px;
+    font-weight: bold;
+}
+QLabel#resultUnit {
+    color: #64748b;
+    font-size: 10px;
 }
 QFrame#warningsFrame {
     background: #422006;
@@ -9,6 +9,7 @@ Based on USACE EM 1110-2-1601 and HEC-RAS guidelines
 """
 
 import math
+from functools import lru_cache
 from typing import Tuple, Optional
 from enum import Enum
 
@@ -43,6 +44,7 @@ def get_cs_value(rock_type: RockType) -> float:
     return CS_VALUES.get(rock_type, 0.375)
 
 
+@lru_cache(maxsize=128)
 def calculate_cv(channel_type: str = "straight",
                  bend_radius: Optional[float] = None,
                  channel_width: Optional[float] = None) -> float:
@@ -105,6 +107,7 @@ def calculate_cv(channel_type: str = "straight",
         raise ValueError(f"channel_type inconnu: {channel_type}")
 
 
+@lru_cache(maxsize=128)
 def calculate_k1(slope_angle: float,
                  repose_angle: float = 40.0,
                  method: str = "analytical") -> float:
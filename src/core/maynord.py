@@ -12,6 +12,7 @@ References:
 """
 
 import math
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
@@ -95,6 +96,14 @@ class MaynordResult:
     is_valid: bool = True
     warnings: list = field(default_factory=list)
 
+    # Statut Froude (OK / LIMITE), calculé à la construction
+    status_ok: bool = field(init=False)
+    status_text: str = field(init=False)
+
+    def __post_init__(self):
+        self.status_ok = self.froude_number <= MaynordCalculator.MAX_FROUDE
+        self.status_text = "OK" if self.status_ok else "LIMITE"
+
     def get_summary_dict(self) -> dict:
         """Retourne un dictionnaire résumé pour export"""
         return {
@@ -127,8 +136,12 @@ class MaynordCalculator:
     D50_RATIO = 1.30        # D50/D30
     D100_RATIO = 2.10       # D100/D30
 
-    def __init__(self):
-        pass
+    # Nombre de résultats gardés en cache (entrées identiques)
+    CACHE_SIZE = 64
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
 
     def calculate(self,
                   velocity: float,
@@ -154,7 +167,32 @@ class MaynordCalculator:
 
         Returns:
             MaynordResult avec d30, d50, d100, masses et épaisseur
+
+        Note:
+            Les résultats sont mis en cache (LRU) par jeu d'entrées arrondies
+            à 1e-6; un même objet MaynordResult est retourné pour des entrées
+            identiques et ne doit pas être modifié.
         """
+        key = tuple(round(x, 6) for x in (
+            velocity, depth, safety_factor, stability_coef, velocity_coef,
+            thickness_coef, side_slope_factor, specific_gravity))
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            return result
+
+        result = self._compute(velocity, depth, safety_factor, stability_coef,
+                               velocity_coef, thickness_coef, side_slope_factor,
+                               specific_gravity)
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _compute(self, velocity: float, depth: float, safety_factor: float,
+                 stability_coef: float, velocity_coef: float, thickness_coef: float,
+                 side_slope_factor: float, specific_gravity: float) -> MaynordResult:
+        """Calcul Maynord proprement dit (sans cache), voir calculate()"""
         warnings = []
 
         # Validation des entrées
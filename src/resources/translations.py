@@ -3,31 +3,38 @@ Internationalization (i18n) for Maynord Calculator
 Supports: French (FR) and English (EN)
 """
 
-from typing import Dict
-from enum import Enum
+import functools
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping
 
 
-class Language(Enum):
-    FR = "fr"
-    EN = "en"
+class Language:
+    """Supported language codes (plain strings)"""
+    FR: Final = "fr"
+    EN: Final = "en"
 
 
 # Current language (mutable at runtime)
 _current_language = Language.FR
+# [current language table, French fallback table], read by tr() on every call.
+# Mutated in place so tr() can bind it as a local; filled at the bottom of the
+# module, once the tables can be built.
+_tables: List[Mapping[str, str]] = [{}, {}]
 
 
-def set_language(lang: Language):
+def set_language(lang: str):
     """Set the current language"""
     global _current_language
     _current_language = lang
+    _tables[0] = _lang(lang)
 
 
-def get_language() -> Language:
+def get_language() -> str:
     """Get the current language"""
     return _current_language
 
 
-def tr(key: str) -> str:
+def tr(key: str, _tables=_tables) -> str:
     """
     Translate a key to the current language
 
@@ -37,265 +44,271 @@ def tr(key: str) -> str:
     Returns:
         Translated string
     """
-    lang = _current_language.value
-    keys = key.split('.')
-
-    result = TRANSLATIONS.get(lang, TRANSLATIONS['fr'])
-    for k in keys:
-        if isinstance(result, dict):
-            result = result.get(k, key)
-        else:
-            return key
-    return result if isinstance(result, str) else key
-
-
-TRANSLATIONS: Dict[str, Dict] = {
-    'fr': {
-        'app': {
-            'title': 'Maynord Calculator',
-            'subtitle': 'Dimensionnement d\'enrochements',
-        },
-        'tabs': {
-            'calculator': 'Calculateur',
-            'comparison': 'Comparaison',
-            'project': 'Projet',
-            'settings': 'Paramètres',
-        },
-        'input': {
-            'title': 'Paramètres hydrauliques',
-            'velocity': 'Vitesse V',
-            'velocity_unit': 'm/s',
-            'depth': 'Profondeur D',
-            'depth_unit': 'm',
-            'section_type': 'Type de section',
-            'bed': 'Lit de rivière',
-            'side_slope': 'Talus latéral',
-            'slope_angle': 'Angle du talus',
-            'slope_ratio': 'Pente (H:V)',
-            'channel_config': 'Configuration du chenal',
-            'straight': 'Chenal droit',
-            'transition': 'Zone de transition',
-            'bend': 'Courbe',
-            'bend_radius': 'Rayon de courbure R',
-            'channel_width': 'Largeur du chenal W',
-        },
-        'coefficients': {
-            'title': 'Coefficients',
-            'safety_factor': 'Facteur de sécurité SF',
-            'stability': 'Coefficient de stabilité Cs',
-            'rock_type': 'Type de roche',
-            'angular': 'Angulaire (concassé)',
-            'rounded': 'Arrondi (galets)',
-            'custom': 'Personnalisé',
-            'velocity_coef': 'Coefficient de vitesse Cv',
-            'thickness_coef': 'Coefficient d\'épaisseur CT',
-            'side_slope_factor': 'Facteur de pente K1',
-            'specific_gravity': 'Densité relative Ss',
-        },
-        'results': {
-            'title': 'Résultats',
-            'd30': 'D30 calculé',
-            'd50': 'D50 estimé',
-            'd100': 'D100 estimé',
-            'mass_d30': 'Masse D30',
-            'mass_d50': 'Masse D50',
-            'mass_d100': 'Masse D100',
-            'thickness': 'Épaisseur de couche',
-            'gradation_class': 'Classe de gradation',
-            'froude': 'Nombre de Froude',
-            'status': 'Statut',
-            'stable': 'STABLE',
-            'marginal': 'LIMITE',
-            'unstable': 'INSTABLE',
-            'mass_per_m2': 'Masse par m²',
-        },
-        'units': {
-            'mm': 'mm',
-            'cm': 'cm',
-            'm': 'm',
-            'kg': 'kg',
-            'kg_m2': 'kg/m²',
-            't': 't',
-            'ms': 'm/s',
-            'degrees': '°',
-        },
-        'buttons': {
-            'calculate': 'Calculer',
-            'reset': 'Réinitialiser',
-            'export_excel': 'Export Excel',
-            'export_pdf': 'Export PDF',
-            'save': 'Sauvegarder',
-            'load': 'Charger',
-            'new_project': 'Nouveau projet',
-            'add_scenario': 'Ajouter scénario',
-            'delete': 'Supprimer',
-        },
-        'messages': {
-            'warning': 'Attention',
-            'error': 'Erreur',
-            'success': 'Succès',
-            'froude_warning': 'Froude > 1.2: hors domaine de validité',
-            'slope_warning': 'Pente > 2%: extrapolation',
-            'saved': 'Projet sauvegardé',
-            'exported': 'Export réussi',
-        },
-        'project': {
-            'title': 'Gestion de projet',
-            'name': 'Nom du projet',
-            'engineer': 'Ingénieur',
-            'date': 'Date',
-            'location': 'Localisation',
-            'notes': 'Notes',
-            'history': 'Historique des calculs',
-        },
-        'comparison': {
-            'title': 'Comparaison de scénarios',
-            'scenario': 'Scénario',
-            'description': 'Description',
-            'import_excel': 'Importer depuis Excel',
-        },
-        'settings': {
-            'title': 'Paramètres',
-            'language': 'Langue',
-            'theme': 'Thème',
-            'light': 'Clair',
-            'dark': 'Sombre',
-            'precision': 'Précision d\'affichage',
-            'default_values': 'Valeurs par défaut',
-            'about': 'À propos',
-        },
-        'about': {
-            'title': 'À propos',
-            'version': 'Version',
-            'description': 'Application de dimensionnement d\'enrochements selon la méthode Maynord (USACE)',
-            'references': 'Références',
-            'ref1': 'Maynord, S.T. (1988) - Technical Report HL-88-4',
-            'ref2': 'USACE EM 1110-2-1601',
-            'ref3': 'HEC-RAS Hydraulic Reference Manual',
-        },
-    },
-    'en': {
-        'app': {
-            'title': 'Maynord Calculator',
-            'subtitle': 'Riprap Sizing',
-        },
-        'tabs': {
-            'calculator': 'Calculator',
-            'comparison': 'Comparison',
-            'project': 'Project',
-            'settings': 'Settings',
-        },
-        'input': {
-            'title': 'Hydraulic Parameters',
-            'velocity': 'Velocity V',
-            'velocity_unit': 'm/s',
-            'depth': 'Depth D',
-            'depth_unit': 'm',
-            'section_type': 'Section Type',
-            'bed': 'Channel Bed',
-            'side_slope': 'Side Slope',
-            'slope_angle': 'Slope Angle',
-            'slope_ratio': 'Slope (H:V)',
-            'channel_config': 'Channel Configuration',
-            'straight': 'Straight Channel',
-            'transition': 'Transition Zone',
-            'bend': 'Bend',
-            'bend_radius': 'Bend Radius R',
-            'channel_width': 'Channel Width W',
-        },
-        'coefficients': {
-            'title': 'Coefficients',
-            'safety_factor': 'Safety Factor SF',
-            'stability': 'Stability Coefficient Cs',
-            'rock_type': 'Rock Type',
-            'angular': 'Angular (crushed)',
-            'rounded': 'Rounded (cobbles)',
-            'custom': 'Custom',
-            'velocity_coef': 'Velocity Coefficient Cv',
-            'thickness_coef': 'Thickness Coefficient CT',
-            'side_slope_factor': 'Side Slope Factor K1',
-            'specific_gravity': 'Specific Gravity Ss',
-        },
-        'results': {
-            'title': 'Results',
-            'd30': 'D30 Calculated',
-            'd50': 'D50 Estimated',
-            'd100': 'D100 Estimated',
-            'mass_d30': 'Mass D30',
-            'mass_d50': 'Mass D50',
-            'mass_d100': 'Mass D100',
-            'thickness': 'Layer Thickness',
-            'gradation_class': 'Gradation Class',
-            'froude': 'Froude Number',
-            'status': 'Status',
-            'stable': 'STABLE',
-            'marginal': 'MARGINAL',
-            'unstable': 'UNSTABLE',
-            'mass_per_m2': 'Mass per m²',
-        },
-        'units': {
-            'mm': 'mm',
-            'cm': 'cm',
-            'm': 'm',
-            'kg': 'kg',
-            'kg_m2': 'kg/m²',
-            't': 't',
-            'ms': 'm/s',
-            'degrees': '°',
-        },
-        'buttons': {
-            'calculate': 'Calculate',
-            'reset': 'Reset',
-            'export_excel': 'Export Excel',
-            'export_pdf': 'Export PDF',
-            'save': 'Save',
-            'load': 'Load',
-            'new_project': 'New Project',
-            'add_scenario': 'Add Scenario',
-            'delete': 'Delete',
-        },
-        'messages': {
-            'warning': 'Warning',
-            'error': 'Error',
-            'success': 'Success',
-            'froude_warning': 'Froude > 1.2: outside validity range',
-            'slope_warning': 'Slope > 2%: extrapolation',
-            'saved': 'Project saved',
-            'exported': 'Export successful',
-        },
-        'project': {
-            'title': 'Project Management',
-            'name': 'Project Name',
-            'engineer': 'Engineer',
-            'date': 'Date',
-            'location': 'Location',
-            'notes': 'Notes',
-            'history': 'Calculation History',
-        },
-        'comparison': {
-            'title': 'Scenario Comparison',
-            'scenario': 'Scenario',
-            'description': 'Description',
-            'import_excel': 'Import from Excel',
-        },
-        'settings': {
-            'title': 'Settings',
-            'language': 'Language',
-            'theme': 'Theme',
-            'light': 'Light',
-            'dark': 'Dark',
-            'precision': 'Display Precision',
-            'default_values': 'Default Values',
-            'about': 'About',
-        },
-        'about': {
-            'title': 'About',
-            'version': 'Version',
-            'description': 'Riprap sizing application using the Maynord method (USACE)',
-            'references': 'References',
-            'ref1': 'Maynord, S.T. (1988) - Technical Report HL-88-4',
-            'ref2': 'USACE EM 1110-2-1601',
-            'ref3': 'HEC-RAS Hydraulic Reference Manual',
-        },
-    },
-}
+    return _tables[0].get(key) or _tables[1].get(key, key)
+
+
+def tr_section(prefix: str) -> Mapping[str, str]:
+    """
+    Translate every key of a section at once
+
+    Args:
+        prefix: Section name (e.g., "project")
+
+    Returns:
+        Read-only mapping of short key -> translated string
+        (e.g., tr_section("project")["name"] == tr("project.name"))
+    """
+    return _section(_current_language, prefix)
+
+
+def _build_fr() -> Dict[str, str]:
+    """French translations, keyed by dotted path"""
+    return {
+        'app.title': 'Maynord Calculator',
+        'app.subtitle': 'Dimensionnement d\'enrochements',
+
+        'tabs.calculator': 'Calculateur',
+        'tabs.comparison': 'Comparaison',
+        'tabs.project': 'Projet',
+        'tabs.settings': 'Paramètres',
+
+        'input.title': 'Paramètres hydrauliques',
+        'input.velocity': 'Vitesse V',
+        'input.velocity_unit': 'm/s',
+        'input.depth': 'Profondeur D',
+        'input.depth_unit': 'm',
+        'input.section_type': 'Type de section',
+        'input.bed': 'Lit de rivière',
+        'input.side_slope': 'Talus latéral',
+        'input.slope_angle': 'Angle du talus',
+        'input.slope_ratio': 'Pente (H:V)',
+        'input.channel_config': 'Configuration du chenal',
+        'input.straight': 'Chenal droit',
+        'input.transition': 'Zone de transition',
+        'input.bend': 'Courbe',
+        'input.bend_radius': 'Rayon de courbure R',
+        'input.channel_width': 'Largeur du chenal W',
+
+        'coefficients.title': 'Coefficients',
+        'coefficients.safety_factor': 'Facteur de sécurité SF',
+        'coefficients.stability': 'Coefficient de stabilité Cs',
+        'coefficients.rock_type': 'Type de roche',
+        'coefficients.angular': 'Angulaire (concassé)',
+        'coefficients.rounded': 'Arrondi (galets)',
+        'coefficients.custom': 'Personnalisé',
+        'coefficients.velocity_coef': 'Coefficient de vitesse Cv',
+        'coefficients.thickness_coef': 'Coefficient d\'épaisseur CT',
+        'coefficients.side_slope_factor': 'Facteur de pente K1',
+        'coefficients.specific_gravity': 'Densité relative Ss',
+
+        'results.title': 'Résultats',
+        'results.d30': 'D30 calculé',
+        'results.d50': 'D50 estimé',
+        'results.d100': 'D100 estimé',
+        'results.mass_d30': 'Masse D30',
+        'results.mass_d50': 'Masse D50',
+        'results.mass_d100': 'Masse D100',
+        'results.thickness': 'Épaisseur de couche',
+        'results.gradation_class': 'Classe de gradation',
+        'results.froude': 'Nombre de Froude',
+        'results.status': 'Statut',
+        'results.stable': 'STABLE',
+        'results.marginal': 'LIMITE',
+        'results.unstable': 'INSTABLE',
+        'results.mass_per_m2': 'Masse par m²',
+
+        'units.mm': 'mm',
+        'units.cm': 'cm',
+        'units.m': 'm',
+        'units.kg': 'kg',
+        'units.kg_m2': 'kg/m²',
+        'units.t': 't',
+        'units.ms': 'm/s',
+        'units.degrees': '°',
+
+        'buttons.calculate': 'Calculer',
+        'buttons.reset': 'Réinitialiser',
+        'buttons.export_excel': 'Export Excel',
+        'buttons.export_pdf': 'Export PDF',
+        'buttons.save': 'Sauvegarder',
+        'buttons.load': 'Charger',
+        'buttons.new_project': 'Nouveau projet',
+        'buttons.add_scenario': 'Ajouter scénario',
+        'buttons.delete': 'Supprimer',
+
+        'messages.warning': 'Attention',
+        'messages.error': 'Erreur',
+        'messages.success': 'Succès',
+        'messages.froude_warning': 'Froude > 1.2: hors domaine de validité',
+        'messages.slope_warning': 'Pente > 2%: extrapolation',
+        'messages.saved': 'Projet sauvegardé',
+        'messages.exported': 'Export réussi',
+
+        'project.title': 'Gestion de projet',
+        'project.name': 'Nom du projet',
+        'project.engineer': 'Ingénieur',
+        'project.date': 'Date',
+        'project.location': 'Localisation',
+        'project.notes': 'Notes',
+        'project.history': 'Historique des calculs',
+
+        'comparison.title': 'Comparaison de scénarios',
+        'comparison.scenario': 'Scénario',
+        'comparison.description': 'Description',
+        'comparison.import_excel': 'Importer depuis Excel',
+
+        'settings.title': 'Paramètres',
+        'settings.language': 'Langue',
+        'settings.theme': 'Thème',
+        'settings.light': 'Clair',
+        'settings.dark': 'Sombre',
+        'settings.precision': 'Précision d\'affichage',
+        'settings.default_values': 'Valeurs par défaut',
+        'settings.about': 'À propos',
+
+        'about.title': 'À propos',
+        'about.version': 'Version',
+        'about.description': 'Application de dimensionnement d\'enrochements selon la méthode Maynord (USACE)',
+        'about.references': 'Références',
+        'about.ref1': 'Maynord, S.T. (1988) - Technical Report HL-88-4',
+        'about.ref2': 'USACE EM 1110-2-1601',
+        'about.ref3': 'HEC-RAS Hydraulic Reference Manual',
+    }
+
+
+def _build_en() -> Dict[str, str]:
+    """English translations, keyed by dotted path"""
+    return {
+        'app.title': 'Maynord Calculator',
+        'app.subtitle': 'Riprap Sizing',
+
+        'tabs.calculator': 'Calculator',
+        'tabs.comparison': 'Comparison',
+        'tabs.project': 'Project',
+        'tabs.settings': 'Settings',
+
+        'input.title': 'Hydraulic Parameters',
+        'input.velocity': 'Velocity V',
+        'input.velocity_unit': 'm/s',
+        'input.depth': 'Depth D',
+        'input.depth_unit': 'm',
+        'input.section_type': 'Section Type',
+        'input.bed': 'Channel Bed',
+        'input.side_slope': 'Side Slope',
+        'input.slope_angle': 'Slope Angle',
+        'input.slope_ratio': 'Slope (H:V)',
+        'input.channel_config': 'Channel Configuration',
+        'input.straight': 'Straight Channel',
+        'input.transition': 'Transition Zone',
+        'input.bend': 'Bend',
+        'input.bend_radius': 'Bend Radius R',
+        'input.channel_width': 'Channel Width W',
+
+        'coefficients.title': 'Coefficients',
+        'coefficients.safety_factor': 'Safety Factor SF',
+        'coefficients.stability': 'Stability Coefficient Cs',
+        'coefficients.rock_type': 'Rock Type',
+        'coefficients.angular': 'Angular (crushed)',
+        'coefficients.rounded': 'Rounded (cobbles)',
+        'coefficients.custom': 'Custom',
+        'coefficients.velocity_coef': 'Velocity Coefficient Cv',
+        'coefficients.thickness_coef': 'Thickness Coefficient CT',
+        'coefficients.side_slope_factor': 'Side Slope Factor K1',
+        'coefficients.specific_gravity': 'Specific Gravity Ss',
+
+        'results.title': 'Results',
+        'results.d30': 'D30 Calculated',
+        'results.d50': 'D50 Estimated',
+        'results.d100': 'D100 Estimated',
+        'results.mass_d30': 'Mass D30',
+        'results.mass_d50': 'Mass D50',
+        'results.mass_d100': 'Mass D100',
+        'results.thickness': 'Layer Thickness',
+        'results.gradation_class': 'Gradation Class',
+        'results.froude': 'Froude Number',
+        'results.status': 'Status',
+        'results.stable': 'STABLE',
+        'results.marginal': 'MARGINAL',
+        'results.unstable': 'UNSTABLE',
+        'results.mass_per_m2': 'Mass per m²',
+
+        'units.mm': 'mm',
+        'units.cm': 'cm',
+        'units.m': 'm',
+        'units.kg': 'kg',
+        'units.kg_m2': 'kg/m²',
+        'units.t': 't',
+        'units.ms': 'm/s',
+        'units.degrees': '°',
+
+        'buttons.calculate': 'Calculate',
+        'buttons.reset': 'Reset',
+        'buttons.export_excel': 'Export Excel',
+        'buttons.export_pdf': 'Export PDF',
+        'buttons.save': 'Save',
+        'buttons.load': 'Load',
+        'buttons.new_project': 'New Project',
+        'buttons.add_scenario': 'Add Scenario',
+        'buttons.delete': 'Delete',
+
+        'messages.warning': 'Warning',
+        'messages.error': 'Error',
+        'messages.success': 'Success',
+        'messages.froude_warning': 'Froude > 1.2: outside validity range',
+        'messages.slope_warning': 'Slope > 2%: extrapolation',
+        'messages.saved': 'Project saved',
+        'messages.exported': 'Export successful',
+
+        'project.title': 'Project Management',
+        'project.name': 'Project Name',
+        'project.engineer': 'Engineer',
+        'project.date': 'Date',
+        'project.location': 'Location',
+        'project.notes': 'Notes',
+        'project.history': 'Calculation History',
+
+        'comparison.title': 'Scenario Comparison',
+        'comparison.scenario': 'Scenario',
+        'comparison.description': 'Description',
+        'comparison.import_excel': 'Import from Excel',
+
+        'settings.title': 'Settings',
+        'settings.language': 'Language',
+        'settings.theme': 'Theme',
+        'settings.light': 'Light',
+        'settings.dark': 'Dark',
+        'settings.precision': 'Display Precision',
+        'settings.default_values': 'Default Values',
+        'settings.about': 'About',
+
+        'about.title': 'About',
+        'about.version': 'Version',
+        'about.description': 'Riprap sizing application using the Maynord method (USACE)',
+        'about.references': 'References',
+        'about.ref1': 'Maynord, S.T. (1988) - Technical Report HL-88-4',
+        'about.ref2': 'USACE EM 1110-2-1601',
+        'about.ref3': 'HEC-RAS Hydraulic Reference Manual',
+    }
+
+
+_BUILDERS = {'fr': _build_fr, 'en': _build_en}
+
+
+@functools.cache
+def _lang(code: str) -> Mapping[str, str]:
+    """Read-only flat lookup table for a language, built on first use"""
+    return MappingProxyType(_BUILDERS[code]())
+
+
+@functools.lru_cache(maxsize=None)
+def _section(code: str, prefix: str) -> Mapping[str, str]:
+    """Section view of a language table, falling back to French per key"""
+    start = prefix + '.'
+    plen = len(start)
+    section = {}
+    for table in (_lang(Language.FR), _lang(code)):
+        section.update((k[plen:], v) for k, v in table.items() if k.startswith(start))
+    return MappingProxyType(section)
+
+
+_tables[:] = [_lang(_current_language), _lang(Language.FR)]
@@ -2,13 +2,18 @@
 Calculator Tab - Main calculation interface (Refactored)
 """
 
+import os
+import tempfile
+import weakref
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QDoubleSpinBox, QComboBox, QGroupBox,
     QPushButton, QFrame, QSlider, QRadioButton,
     QButtonGroup, QSplitter, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QSignalBlocker, QTimer
 
 from core.maynord import MaynordCalculator, MaynordResult
 from core.coefficients import (
@@ -19,6 +24,34 @@ from resources.translations import tr
 from ui.widgets.results_panel import ResultsPanel
 from ui.widgets.chart_widget import GradationChart
 
+# Slope text ("2:1") -> slope angle (degrees)
+_SLOPE_ANGLES = {k: v.get('angle', 26.57) for k, v in COMMON_SLOPES.items()}
+
+# Slopes offered in the section configuration
+_SLOPE_OPTIONS = ['3:1', '2.5:1', '2:1', '1.5:1']
+
+# Preformatted label texts for the usual discrete coefficient values
+_CS_TEXT = {cs: f"Cs={cs:.3f}" for cs in (0.375, 0.30)}
+_CV_TEXT = {cv: f"Cv={cv:.3f}" for cv in (1.0, 1.25)}
+_K1_TEXT = {
+    k1: f"K1={k1:.3f}"
+    for k1 in [1.0] + [calculate_k1(_SLOPE_ANGLES[slope]) for slope in _SLOPE_OPTIONS]
+}
+
+
+def _set_if_changed(label: QLabel, text: str):
+    """Set a label's text only if it differs (avoids a relayout/repaint)"""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _remove_temp_file(path: str):
+    """Delete a temp file, ignoring one that is already gone"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 
 class CalculatorTab(QWidget):
     """Main calculator tab"""
@@ -34,6 +67,16 @@ class CalculatorTab(QWidget):
         self.project_manager = project_manager
         self.calculator = MaynordCalculator()
         self.last_result = None
+        self._coeff_cache = None  # (widget state, (cv, k1))
+        # Plain copies of combo values, refreshed when the combos change
+        self._cs = 0.375
+        self._slope_str = '2:1'
+        self._chart = None
+        self._chart_theme = "light"
+        self._chart_png_dirty = True  # Chart changed since the last PNG export
+        self._chart_png_path = None  # Per-instance temp PNG for PDF export
+        self._input_params = None  # Cached get_input_params() result
+        self._comparison_data = None  # Last payload sent to the comparison tab
         self.setup_ui()
         self.connect_signals()
         self.update_coefficients()
@@ -142,11 +185,11 @@ class CalculatorTab(QWidget):
         self.results_panel = ResultsPanel()
         self.v_splitter.addWidget(self.results_panel)
 
-        # Chart
-        self.chart = GradationChart()
-        self.chart.setMinimumHeight(200)
-        self.chart.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.v_splitter.addWidget(self.chart)
+        # Chart (placeholder until the first result, see the chart property)
+        self._chart_placeholder = QWidget()
+        self._chart_placeholder.setMinimumHeight(200)
+        self._chart_placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.v_splitter.addWidget(self._chart_placeholder)
 
         # Set initial vertical sizes
         self.v_splitter.setSizes([280, 400])
@@ -162,6 +205,22 @@ class CalculatorTab(QWidget):
 
         main_layout.addWidget(self.splitter)
 
+    @property
+    def chart(self) -> GradationChart:
+        """Gradation chart, built and swapped into the splitter on first use"""
+        if self._chart is None:
+            chart = GradationChart()
+            chart.setMinimumHeight(200)
+            chart.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            if self._chart_theme != chart.current_theme:
+                chart.set_theme(self._chart_theme)
+            index = self.v_splitter.indexOf(self._chart_placeholder)
+            self.v_splitter.replaceWidget(index, chart)
+            self._chart_placeholder.deleteLater()
+            self._chart_placeholder = None
+            self._chart = chart
+        return self._chart
+
     def create_hydraulic_group(self) -> QGroupBox:
         """Create hydraulic parameters group (compact)"""
         group = QGroupBox("📊 Parametres hydrauliques")
@@ -233,7 +292,7 @@ class CalculatorTab(QWidget):
         layout.addWidget(self.side_radio, 0, 2)
 
         self.slope_combo = QComboBox()
-        self.slope_combo.addItems(['3:1', '2.5:1', '2:1', '1.5:1'])
+        self.slope_combo.addItems(_SLOPE_OPTIONS)
         self.slope_combo.setCurrentIndex(2)
         self.slope_combo.setEnabled(False)
         self.slope_combo.setToolTip("Pente du talus (H:V)")
@@ -359,33 +418,43 @@ class CalculatorTab(QWidget):
 
     def connect_signals(self):
         """Connect UI signals"""
+        # Each slot is declared with the exact signature of the signal it is
+        # connected to (see the @Slot decorators), so Qt matches the
+        # connection on the first lookup instead of normalizing it.
+        # The per-coefficient updaters are shared by several signals and
+        # take no argument.
+
         # Sliders <-> spinboxes
-        self.velocity_slider.valueChanged.connect(
-            lambda v: self.velocity_spin.setValue(v / 10)
-        )
-        self.velocity_spin.valueChanged.connect(
-            lambda v: self.velocity_slider.setValue(int(v * 10))
-        )
-
-        self.depth_slider.valueChanged.connect(
-            lambda v: self.depth_spin.setValue(v / 10)
-        )
-        self.depth_spin.valueChanged.connect(
-            lambda v: self.depth_slider.setValue(int(v * 10))
-        )
-
-        # Section type
-        self.section_group.buttonClicked.connect(self.on_section_changed)
+        self.velocity_slider.valueChanged.connect(self._on_velocity_slider)
+        self.velocity_spin.valueChanged.connect(self._on_velocity_spin)
+
+        self.depth_slider.valueChanged.connect(self._on_depth_slider)
+        self.depth_spin.valueChanged.connect(self._on_depth_spin)
+
+        # Section type (only the newly checked radio reacts)
+        self.bed_radio.toggled.connect(self._on_section_toggled)
+        self.side_radio.toggled.connect(self._on_section_toggled)
 
         # Channel config
-        self.channel_group.buttonClicked.connect(self.on_channel_changed)
+        self.straight_radio.toggled.connect(self._on_channel_toggled)
+        self.transition_radio.toggled.connect(self._on_channel_toggled)
+        self.bend_radio.toggled.connect(self._on_channel_toggled)
 
         # Rock type
         self.rock_combo.currentIndexChanged.connect(self.on_rock_changed)
 
-        # Auto-update coefficients
-        self.slope_combo.currentIndexChanged.connect(self.update_coefficients)
-        self.rw_spin.valueChanged.connect(self.update_coefficients)
+        # Auto-update coefficients (only the one depending on each input)
+        self.slope_combo.currentIndexChanged.connect(self._update_k1)
+        self.rw_spin.valueChanged.connect(self._update_cv)
+
+        # Inputs reported by get_input_params()
+        for widget in (self.velocity_spin, self.velocity_slider,
+                       self.depth_spin, self.depth_slider, self.rw_spin):
+            widget.valueChanged.connect(self._invalidate_input_params)
+        for radio in (self.bed_radio, self.side_radio, self.straight_radio,
+                      self.transition_radio, self.bend_radio):
+            radio.toggled.connect(self._invalidate_input_params)
+        self.slope_combo.currentIndexChanged.connect(self._invalidate_input_params)
 
         # Export buttons
         self.export_excel_btn.clicked.connect(self._on_export_excel)
@@ -394,76 +463,126 @@ class CalculatorTab(QWidget):
         # Add to comparison
         self.add_comparison_btn.clicked.connect(self._on_add_to_comparison)
 
+    @Slot(int)
+    def _on_velocity_slider(self, value: int):
+        """Sync velocity spinbox from slider (slider unit = 0.1 m/s)"""
+        with QSignalBlocker(self.velocity_spin):
+            self.velocity_spin.setValue(value / 10)
+
+    @Slot(float)
+    def _on_velocity_spin(self, value: float):
+        """Sync velocity slider from spinbox"""
+        with QSignalBlocker(self.velocity_slider):
+            self.velocity_slider.setValue(int(value * 10))
+
+    @Slot(int)
+    def _on_depth_slider(self, value: int):
+        """Sync depth spinbox from slider (slider unit = 0.1 m)"""
+        with QSignalBlocker(self.depth_spin):
+            self.depth_spin.setValue(value / 10)
+
+    @Slot(float)
+    def _on_depth_spin(self, value: float):
+        """Sync depth slider from spinbox"""
+        with QSignalBlocker(self.depth_slider):
+            self.depth_slider.setValue(int(value * 10))
+
+    @Slot(bool)
+    def _on_section_toggled(self, checked: bool):
+        """Ignore the radio being unchecked; re-clicking the checked one emits nothing"""
+        if checked:
+            self.on_section_changed()
+
+    @Slot(bool)
+    def _on_channel_toggled(self, checked: bool):
+        """Ignore the radio being unchecked; re-clicking the checked one emits nothing"""
+        if checked:
+            self.on_channel_changed()
+
     def on_section_changed(self):
         """Handle section type change"""
         is_side = self.side_radio.isChecked()
         self.slope_combo.setEnabled(is_side)
         self.slope_label.setEnabled(is_side)
-        self.update_coefficients()
+        self._update_k1()
 
     def on_channel_changed(self):
         """Handle channel config change"""
         is_bend = self.bend_radio.isChecked()
         self.rw_spin.setEnabled(is_bend)
         self.rw_label.setEnabled(is_bend)
-        self.update_coefficients()
+        self._update_cv()
 
-    def on_rock_changed(self):
+    @Slot(int)
+    def on_rock_changed(self, _index: int = 0):
         """Handle rock type change"""
-        cs = self.rock_combo.currentData()
-        self.cs_label.setText(f"Cs={cs:.3f}")
+        self._update_cs()
 
+    @Slot()
     def update_coefficients(self):
-        """Update coefficient displays"""
-        # Cs
-        cs = self.rock_combo.currentData()
-        self.cs_label.setText(f"Cs={cs:.3f}")
+        """Update all coefficient displays (initial setup and reset)"""
+        self._update_cs()
+        self._update_k1()
+        self._update_cv()
+
+    def _update_cs(self):
+        """Update the Cs display from the rock type"""
+        self._cs = self.rock_combo.currentData()
+        _set_if_changed(self.cs_label, _CS_TEXT.get(self._cs) or f"Cs={self._cs:.3f}")
+
+    @Slot()
+    def _update_cv(self):
+        """Update the Cv display from the channel configuration"""
+        cv, _ = self._current_cv_k1()
+        _set_if_changed(self.cv_label, _CV_TEXT.get(cv) or f"Cv={cv:.3f}")
+
+    @Slot()
+    def _update_k1(self):
+        """Update the K1 display from the section type and slope"""
+        self._slope_str = self.slope_combo.currentText()
+        _, k1 = self._current_cv_k1()
+        _set_if_changed(self.k1_label, _K1_TEXT.get(k1) or f"K1={k1:.3f}")
+
+    def _current_cv_k1(self) -> tuple:
+        """Return (Cv, K1) for the current channel/section configuration"""
+        straight = self.straight_radio.isChecked()
+        transition = self.transition_radio.isChecked()
+        bed = self.bed_radio.isChecked()
+        rw = self.rw_spin.value()
+        slope_str = self._slope_str
+        state = (straight, transition, bed, rw, slope_str)
+        if self._coeff_cache is not None and self._coeff_cache[0] == state:
+            return self._coeff_cache[1]
 
         # Cv
-        if self.straight_radio.isChecked():
+        if straight:
             cv = 1.0
-        elif self.transition_radio.isChecked():
+        elif transition:
             cv = 1.25
         else:  # bend
-            cv = calculate_cv("bend", self.rw_spin.value(), 1.0)
-
-        self.cv_label.setText(f"Cv={cv:.3f}")
+            cv = calculate_cv("bend", rw, 1.0)
 
         # K1
-        if self.bed_radio.isChecked():
+        if bed:
             k1 = 1.0
         else:
-            slope_str = self.slope_combo.currentText()
-            angle = COMMON_SLOPES.get(slope_str, {}).get('angle', 26.57)
+            angle = _SLOPE_ANGLES.get(slope_str, 26.57)
             k1 = calculate_k1(angle)
 
-        self.k1_label.setText(f"K1={k1:.3f}")
+        self._coeff_cache = (state, (cv, k1))
+        return cv, k1
 
+    @Slot()
     def calculate(self):
         """Perform the Maynord calculation"""
         velocity = self.velocity_spin.value()
         depth = self.depth_spin.value()
         sf = self.sf_spin.value()
-        cs = self.rock_combo.currentData()
+        cs = self._cs
         ss = self.ss_spin.value()
         ct = self.ct_spin.value()
 
-        # Cv
-        if self.straight_radio.isChecked():
-            cv = 1.0
-        elif self.transition_radio.isChecked():
-            cv = 1.25
-        else:
-            cv = calculate_cv("bend", self.rw_spin.value(), 1.0)
-
-        # K1
-        if self.bed_radio.isChecked():
-            k1 = 1.0
-        else:
-            slope_text = self.slope_combo.currentText()
-            slope_str = slope_text.split(' ')[0]
-            angle = COMMON_SLOPES.get(slope_str, {}).get('angle', 26.57)
-            k1 = calculate_k1(angle)
+        cv, k1 = self._current_cv_k1()
 
         try:
             result = self.calculator.calculate(
@@ -478,39 +597,75 @@ class CalculatorTab(QWidget):
             )
 
             self.last_result = result
+            self._input_params = self._compute_input_params()
             self.results_panel.update_results(result)
             self.chart.update_chart(result)
+            self._chart_png_dirty = True
             self.calculation_done.emit(result)
             self._enable_export_buttons()
 
-            # Add to project history
-            self.project_manager.add_calculation({
-                'velocity': velocity,
-                'depth': depth,
-                'result': result.get_summary_dict(),
-                'coefficients': result.coefficients,
-            })
+            # Add to project history once the results have been painted
+            # (self as context: the call is dropped if the tab is destroyed first)
+            QTimer.singleShot(
+                0, self, lambda: self._record_calculation(velocity, depth, result)
+            )
 
         except Exception as e:
             self.results_panel.show_error(str(e))
 
+    def _record_calculation(self, velocity: float, depth: float, result: MaynordResult):
+        """Add a calculation to the project history"""
+        self.project_manager.add_calculation({
+            'velocity': velocity,
+            'depth': depth,
+            'result': result.get_summary_dict(),
+            'coefficients': result.coefficients,
+        })
+
+    @contextmanager
+    def _batch_updates(self):
+        """Block input widget signals while several values are set at once"""
+        widgets = [
+            self.velocity_spin, self.velocity_slider,
+            self.depth_spin, self.depth_slider,
+            self.sf_spin, self.rock_combo, self.ss_spin, self.ct_spin,
+            self.bed_radio, self.side_radio,
+            self.straight_radio, self.transition_radio, self.bend_radio,
+            self.rw_spin, self.slope_combo,
+        ]
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
+    @Slot()
     def reset(self):
         """Reset to default values"""
-        self.velocity_spin.setValue(2.0)
-        self.depth_spin.setValue(1.5)
-        self.sf_spin.setValue(1.1)
-        self.rock_combo.setCurrentIndex(0)
-        self.ss_spin.setValue(2.65)
-        self.ct_spin.setValue(1.0)
-        self.bed_radio.setChecked(True)
-        self.straight_radio.setChecked(True)
-        self.slope_combo.setEnabled(False)
-        self.rw_spin.setEnabled(False)
-        self.rw_spin.setValue(10.0)
-        self.slope_combo.setCurrentIndex(2)
+        with self._batch_updates():
+            self.velocity_spin.setValue(2.0)
+            self.velocity_slider.setValue(20)
+            self.depth_spin.setValue(1.5)
+            self.depth_slider.setValue(15)
+            self.sf_spin.setValue(1.1)
+            self.rock_combo.setCurrentIndex(0)
+            self.ss_spin.setValue(2.65)
+            self.ct_spin.setValue(1.0)
+            self.bed_radio.setChecked(True)
+            self.straight_radio.setChecked(True)
+            self.slope_combo.setEnabled(False)
+            self.slope_label.setEnabled(False)
+            self.rw_spin.setEnabled(False)
+            self.rw_label.setEnabled(False)
+            self.rw_spin.setValue(10.0)
+            self.slope_combo.setCurrentIndex(2)
+        self._invalidate_input_params()
         self.update_coefficients()
         self.results_panel.clear()
-        self.chart.clear()
+        if self._chart is not None:
+            self._chart.clear()
+            self._chart_png_dirty = True
 
     def refresh_labels(self):
         """Refresh labels after language change"""
@@ -520,10 +675,25 @@ class CalculatorTab(QWidget):
 
     def on_theme_changed(self, theme: str):
         """Handle theme change - update chart"""
-        self.chart.set_theme(theme)
+        self._chart_theme = theme
+        if self._chart is not None:
+            self._chart.set_theme(theme)
+            self._chart_png_dirty = True
 
     def get_input_params(self) -> dict:
-        """Get current input parameters as dict"""
+        """Get current input parameters as dict (cached since the last calculation)"""
+        if self._input_params is None:
+            self._input_params = self._compute_input_params()
+        return dict(self._input_params)
+
+    @Slot()
+    def _invalidate_input_params(self):
+        """Forget the cached input parameters after an input change"""
+        self._input_params = None
+        self._comparison_data = None
+
+    def _compute_input_params(self) -> dict:
+        """Read the input parameters from the widgets"""
         params = {
             'velocity': self.velocity_spin.value(),
             'depth': self.depth_spin.value(),
@@ -533,7 +703,7 @@ class CalculatorTab(QWidget):
             ),
         }
         if self.side_radio.isChecked():
-            params['slope'] = self.slope_combo.currentText()
+            params['slope'] = self._slope_str
         if self.bend_radio.isChecked():
             params['rw_ratio'] = self.rw_spin.value()
         return params
@@ -542,30 +712,48 @@ class CalculatorTab(QWidget):
         """Save current chart as image"""
         self.chart.save_image(filepath)
 
+    def get_chart_image(self) -> str:
+        """Return the path of a temp PNG of the chart, re-rendered only if the chart changed"""
+        if self._chart_png_path is None:
+            # Fichier propre a cet onglet: une autre instance ne peut pas l'ecraser
+            fd, self._chart_png_path = tempfile.mkstemp(prefix='maynord_chart_', suffix='.png')
+            os.close(fd)
+            self._chart_png_dirty = True
+            # Supprime a la destruction de l'onglet ou a la sortie de l'interpreteur
+            weakref.finalize(self, _remove_temp_file, self._chart_png_path)
+        if self._chart_png_dirty or not os.path.exists(self._chart_png_path):
+            self.save_chart_image(self._chart_png_path)
+            self._chart_png_dirty = False
+        return self._chart_png_path
+
+    @Slot()
     def _on_export_excel(self):
         """Handle Excel export request"""
         if self.last_result:
             self.export_excel_requested.emit(self.last_result, self.get_input_params())
 
+    @Slot()
     def _on_export_pdf(self):
         """Handle PDF export request"""
         if self.last_result:
-            import tempfile
-            import os
-            # Save chart to temp file
-            temp_chart = os.path.join(tempfile.gettempdir(), 'maynord_chart.png')
-            self.save_chart_image(temp_chart)
-            self.export_pdf_requested.emit(self.last_result, self.get_input_params(), temp_chart)
+            self.export_pdf_requested.emit(
+                self.last_result, self.get_input_params(), self.get_chart_image()
+            )
 
+    @Slot()
     def _on_add_to_comparison(self):
         """Add current calculation to comparison tab"""
         if self.last_result:
-            calc_data = {
-                'velocity': self.velocity_spin.value(),
-                'depth': self.depth_spin.value(),
-                'result': self.last_result,
-                'input_params': self.get_input_params(),
-            }
+            calc_data = self._comparison_data
+            if calc_data is None or calc_data['result'] is not self.last_result:
+                params = self.get_input_params()
+                calc_data = {
+                    'velocity': params['velocity'],
+                    'depth': params['depth'],
+                    'result': self.last_result,
+                    'input_params': params,
+                }
+                self._comparison_data = calc_data
             self.add_to_comparison_requested.emit(calc_data)
 
     def _enable_export_buttons(self):
@@ -2,18 +2,139 @@
 Comparison Tab - Multi-scenario comparison with enhanced features
 """
 
+from contextlib import contextmanager
+from typing import NamedTuple
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
     QTableWidgetItem, QPushButton, QHeaderView, QLabel,
     QFileDialog, QMessageBox, QSplitter, QFrame, QGridLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QSignalBlocker, QThread, QTimer, Signal, Slot
 from PySide6.QtGui import QColor
 
-from core.maynord import MaynordCalculator
+from core.maynord import MaynordCalculator, MaynordResult
 from resources.translations import tr
 from ui.widgets.chart_widget import GradationChart
 
+# Default comparison table column widths (column 1 stretches)
+_COLUMN_WIDTHS = [40, 60, 70, 70, 50, 60, 60, 60, 80, 80, 90, 80]
+
+# Table cell colors (background, foreground) per (theme, cell kind),
+# parsed once instead of on every recolor
+_PALETTE = {
+    ("light", "ok"): (QColor("#dcfce7"), QColor("#166534")),
+    ("light", "limit"): (QColor("#fef3c7"), QColor("#92400e")),
+    ("light", "result"): (QColor("#f1f5f9"), QColor("#1e293b")),
+    ("light", "input"): (None, QColor("#1e293b")),
+    ("dark", "ok"): (QColor("#14532d"), QColor("#86efac")),
+    ("dark", "limit"): (QColor("#422006"), QColor("#fcd34d")),
+    ("dark", "result"): (QColor("#334155"), QColor("#e2e8f0")),
+    ("dark", "input"): (None, QColor("#e2e8f0")),
+}
+
+
+def _read_excel_rows(filename: str) -> list:
+    """Cell values of the first sheet, header row excluded.
+
+    Uses python-calamine (Rust reader) when installed, openpyxl otherwise.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        import openpyxl
+        wb = openpyxl.load_workbook(filename, read_only=True, data_only=True)
+        try:
+            return list(wb.active.iter_rows(min_row=2, values_only=True))
+        finally:
+            wb.close()
+
+    return CalamineWorkbook.from_path(filename).get_sheet_by_index(0).to_python()[1:]
+
+
+def _default_row_values(row: int) -> list:
+    """Cell texts of a new, not yet calculated scenario row"""
+    return [
+        str(row + 1),  # #
+        f"Scenario {row + 1}",  # Description
+        "2.0",  # V
+        "1.5",  # D
+        "1.1",  # SF
+        "0.375",  # Cs
+        "1.0",  # Cv
+        "1.0",  # K1
+        "--",  # D30
+        "--",  # D50
+        "--",  # Mass
+        "--",  # Status
+    ]
+
+
+class ScenarioRow(NamedTuple):
+    """Calculated comparison row with its precomputed status flag"""
+    result: MaynordResult
+    is_ok: bool
+
+
+def _result_cells(result: MaynordResult) -> list:
+    """Texts of the result columns (D30, D50, Mass, Status)"""
+    return [
+        f"{result.d30:.1f}",  # D30
+        f"{result.d50:.1f}",  # D50
+        f"{result.mass_d50:.1f}",  # Mass
+        result.status_text,  # Status
+    ]
+
+
+class _ImportWorker(QObject):
+    """Reads an Excel file and calculates its scenarios off the GUI thread"""
+
+    finished = Signal(list)  # [(row values, MaynordResult or None)]
+    failed = Signal(str)
+
+    def __init__(self, filename: str):
+        super().__init__()
+        self.filename = filename
+
+    @Slot()
+    def run(self):
+        try:
+            # Read rows (skip header and empty rows)
+            rows = [
+                (row_idx, row)
+                for row_idx, row in enumerate(_read_excel_rows(self.filename), 1)
+                if row and row[0]
+            ]
+
+            # Own calculator: its result cache is not shared across threads
+            calculator = MaynordCalculator()
+            parsed = []
+            for table_row, (row_idx, row) in enumerate(rows):
+                values = _default_row_values(table_row)
+
+                # Map Excel columns to table columns
+                # Expecting: Description, V, D, SF, Cs, Cv, K1
+                if len(row) >= 7:
+                    values[1] = str(row[0] or f"Scenario {row_idx}")
+                    for col, (cell, default) in enumerate(
+                            zip(row[1:7], values[2:8]), 2):
+                        values[col] = str(cell or default)
+
+                try:
+                    v, d, sf, cs, cv, k1 = (float(value) for value in values[2:8])
+                    result = calculator.calculate(
+                        velocity=v, depth=d, safety_factor=sf,
+                        stability_coef=cs, velocity_coef=cv, side_slope_factor=k1
+                    )
+                    values[8:] = _result_cells(result)
+                except ValueError:
+                    result = None  # Invalid input, skip calculation
+                parsed.append((values, result))
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(parsed)
+
 
 class ComparisonTab(QWidget):
     """Tab for comparing multiple scenarios"""
@@ -21,19 +142,64 @@ class ComparisonTab(QWidget):
     def __init__(self, project_manager):
         super().__init__()
         self.project_manager = project_manager
-        self.calculator = MaynordCalculator()
+        # Large result cache: rows are recalculated on every edit, import and
+        # revert, usually with inputs already seen
+        self.calculator = MaynordCalculator(cache_size=1024)
         self.scenarios = []
+        # Results of the calculated rows in row order, rebuilt after changes
+        self._valid_results = None
+        # Table items per row, to avoid table.item() lookups
+        self._row_items = []
         self.current_theme = "light"
+
+        # Edited rows are recalculated together once edits settle
+        self._dirty_rows = set()
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(150)
+        self._recalc_timer.timeout.connect(self._flush_recalc)
+
+        # Chart/summary refreshes skipped while hidden, done on next show
+        # (the chart itself is only built when the tab is first shown)
+        self._chart = None
+        self._chart_dirty = True
+        self._summary_dirty = False
+
         self.setup_ui()
 
+    def showEvent(self, event):
+        """Apply the chart/summary refreshes deferred while hidden"""
+        super().showEvent(event)
+        if self._chart_dirty:
+            self.update_chart()
+        if self._summary_dirty:
+            self.update_summary()
+
     def set_theme(self, theme: str):
         """Set the current theme and refresh display"""
+        if theme == self.current_theme:
+            return
         self.current_theme = theme
-        self.chart.set_theme(theme)
+        if self._chart is not None:
+            self._chart.set_theme(theme)
         self.update_title_style()
         self.update_table_colors()
         # Redraw chart with existing data
-        self.update_chart()
+        if self.scenarios:
+            self.update_chart()
+
+    @property
+    def chart(self) -> GradationChart:
+        """Comparison chart, built and swapped in for the placeholder on first use"""
+        if self._chart is None:
+            chart = GradationChart()
+            if self.current_theme != chart.current_theme:
+                chart.set_theme(self.current_theme)
+            self._chart_layout.replaceWidget(self._chart_placeholder, chart)
+            self._chart_placeholder.deleteLater()
+            self._chart_placeholder = None
+            self._chart = chart
+        return self._chart
 
     def update_title_style(self):
         """Update title style based on theme"""
@@ -42,42 +208,50 @@ class ComparisonTab(QWidget):
         else:
             self.title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #1e40af;")
 
+    @contextmanager
+    def _batch_table_updates(self):
+        """Suspend table repaints and cellChanged while many cells are set (nestable)"""
+        updates_enabled = self.table.updatesEnabled()
+        self.table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.table)
+        try:
+            yield
+        finally:
+            blocker.unblock()
+            if updates_enabled:
+                self.table.setUpdatesEnabled(True)
+                self.table.viewport().update()
+
     def update_table_colors(self):
         """Update table colors based on theme"""
-        for row in range(self.table.rowCount()):
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    if col >= 8:  # Results columns
-                        if col == 11:  # Status column
-                            status_text = item.text()
-                            if "OK" in status_text:
-                                if self.current_theme == "dark":
-                                    item.setBackground(QColor("#14532d"))
-                                    item.setForeground(QColor("#86efac"))
-                                else:
-                                    item.setBackground(QColor("#dcfce7"))
-                                    item.setForeground(QColor("#166534"))
-                            else:
-                                if self.current_theme == "dark":
-                                    item.setBackground(QColor("#422006"))
-                                    item.setForeground(QColor("#fcd34d"))
-                                else:
-                                    item.setBackground(QColor("#fef3c7"))
-                                    item.setForeground(QColor("#92400e"))
-                        else:
-                            if self.current_theme == "dark":
-                                item.setBackground(QColor("#334155"))
-                                item.setForeground(QColor("#e2e8f0"))
-                            else:
-                                item.setBackground(QColor("#f1f5f9"))
-                                item.setForeground(QColor("#1e293b"))
-                    else:
-                        # Input columns
-                        if self.current_theme == "dark":
-                            item.setForeground(QColor("#e2e8f0"))
-                        else:
-                            item.setForeground(QColor("#1e293b"))
+        theme = "dark" if self.current_theme == "dark" else "light"
+        with self._batch_table_updates():
+            for row in range(self.table.rowCount()):
+                self._color_row(row, theme)
+
+    def _apply_row_colors(self, row: int):
+        """Color the cells of a single row for the current theme"""
+        theme = "dark" if self.current_theme == "dark" else "light"
+        with self._batch_table_updates():
+            self._color_row(row, theme)
+
+    def _color_row(self, row: int, theme: str):
+        """Set the cell colors of a row (caller batches the table updates)"""
+        scenario = self.scenarios[row] if row < len(self.scenarios) else None
+        status_kind = "ok" if scenario is not None and scenario.is_ok else "limit"
+        input_foreground = _PALETTE[theme, "input"][1]
+        result_colors = _PALETTE[theme, "result"]
+        for col, item in enumerate(self._row_items[row]):
+            if col >= 8:  # Results columns
+                if col == 11:  # Status column
+                    background, foreground = _PALETTE[theme, status_kind]
+                else:
+                    background, foreground = result_colors
+                item.setBackground(background)
+                item.setForeground(foreground)
+            else:
+                # Input columns
+                item.setForeground(input_foreground)
 
     def setup_ui(self):
         """Setup the comparison UI"""
@@ -128,11 +302,18 @@ class ComparisonTab(QWidget):
             '#', 'Description', 'V (m/s)', 'D (m)', 'SF', 'Cs', 'Cv', 'K1',
             'D30 (mm)', 'D50 (mm)', 'Masse (kg)', 'Status'
         ])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        # Fixed default widths instead of ResizeToContents, which re-measures
+        # every cell on each change
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        for col, width in enumerate(_COLUMN_WIDTHS):
+            if col != 1:
+                self.table.setColumnWidth(col, width)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
         self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.cellChanged.connect(self.on_cell_changed)
         table_layout.addWidget(self.table)
 
         splitter.addWidget(table_widget)
@@ -167,9 +348,10 @@ class ComparisonTab(QWidget):
 
         chart_layout.addWidget(self.summary_frame)
 
-        # Chart
-        self.chart = GradationChart()
-        chart_layout.addWidget(self.chart, 1)
+        # Chart (placeholder until first shown)
+        self._chart_layout = chart_layout
+        self._chart_placeholder = QWidget()
+        chart_layout.addWidget(self._chart_placeholder, 1)
 
         splitter.addWidget(chart_container)
         splitter.setSizes([250, 350])
@@ -198,64 +380,34 @@ class ComparisonTab(QWidget):
             f"{coeffs.get('Cs', 0.375):.3f}",  # Cs
             f"{coeffs.get('Cv', 1.0):.3f}",  # Cv
             f"{coeffs.get('K1', 1.0):.3f}",  # K1
-            f"{result.d30:.1f}",  # D30
-            f"{result.d50:.1f}",  # D50
-            f"{result.mass_d50:.1f}",  # Mass
-            "OK" if result.froude_number <= 1.2 else "LIMITE",  # Status
-        ]
-
-        for col, value in enumerate(values):
-            item = QTableWidgetItem(value)
-            if col >= 8:  # Results columns (read-only)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, col, item)
-
-        # Store result
-        while len(self.scenarios) <= row:
-            self.scenarios.append(None)
-        self.scenarios[row] = result
+        ] + _result_cells(result)
 
-        # Apply colors and update
-        self.update_table_colors()
+        # Store result before creating the items, the row colors need it
+        self._store_scenario(row, result)
+        self._set_row_items(row, values)
+
+        # Update chart and summary
         self.update_chart()
         self.update_summary()
 
     def add_scenario(self):
         """Add a new scenario row"""
-        # Disconnect to avoid multiple triggers
-        try:
-            self.table.cellChanged.disconnect(self.on_cell_changed)
-        except:
-            pass
-
         row = self.table.rowCount()
         self.table.insertRow(row)
-
-        # Default values
-        defaults = [
-            str(row + 1),  # #
-            f"Scenario {row + 1}",  # Description
-            "2.0",  # V
-            "1.5",  # D
-            "1.1",  # SF
-            "0.375",  # Cs
-            "1.0",  # Cv
-            "1.0",  # K1
-            "--",  # D30
-            "--",  # D50
-            "--",  # Mass
-            "--",  # Status
-        ]
-
-        for col, value in enumerate(defaults):
-            item = QTableWidgetItem(value)
-            if col >= 8:  # Results columns (read-only)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, col, item)
-
-        # Reconnect and apply colors
-        self.table.cellChanged.connect(self.on_cell_changed)
-        self.update_table_colors()
+        self._set_row_items(row, _default_row_values(row))
+
+    def _set_row_items(self, row: int, values: list):
+        """Create the items of a table row (result columns are read-only)"""
+        items = []
+        with self._batch_table_updates():
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if col >= 8:  # Results columns (read-only)
+                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.table.setItem(row, col, item)
+                items.append(item)
+            self._row_items.insert(row, items)
+            self._apply_row_colors(row)
 
     def delete_selected_scenario(self):
         """Delete the currently selected scenario"""
@@ -266,18 +418,22 @@ class ComparisonTab(QWidget):
 
         row = selected_rows[0].row()
 
+        # Pending edits refer to the current row numbers
+        self._flush_recalc()
+
         # Remove from scenarios list
         if row < len(self.scenarios):
             self.scenarios.pop(row)
+            self._valid_results = None
 
         # Remove row from table
         self.table.removeRow(row)
+        del self._row_items[row]
 
         # Renumber remaining rows
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 0)
-            if item:
-                item.setText(str(i + 1))
+        with self._batch_table_updates():
+            for i, items in enumerate(self._row_items):
+                items[0].setText(str(i + 1))
 
         self.update_chart()
         self.update_summary()
@@ -285,19 +441,31 @@ class ComparisonTab(QWidget):
     def on_cell_changed(self, row, col):
         """Handle cell value changes"""
         if col in [2, 3, 4, 5, 6, 7]:  # Input columns
-            self.calculate_row(row)
-            self.update_chart()
-            self.update_summary()
+            self._dirty_rows.add(row)
+            self._recalc_timer.start()
+
+    def _flush_recalc(self):
+        """Recalculate the edited rows, then refresh chart and summary once"""
+        self._recalc_timer.stop()
+        if not self._dirty_rows:
+            return
+        rows, self._dirty_rows = sorted(self._dirty_rows), set()
+        for row in rows:
+            if row < self.table.rowCount():
+                self.calculate_row(row)
+        self.update_chart()
+        self.update_summary()
 
     def calculate_row(self, row):
         """Calculate results for a specific row"""
         try:
-            v = float(self.table.item(row, 2).text())
-            d = float(self.table.item(row, 3).text())
-            sf = float(self.table.item(row, 4).text())
-            cs = float(self.table.item(row, 5).text())
-            cv = float(self.table.item(row, 6).text())
-            k1 = float(self.table.item(row, 7).text())
+            items = self._row_items[row]
+            v = float(items[2].text())
+            d = float(items[3].text())
+            sf = float(items[4].text())
+            cs = float(items[5].text())
+            cv = float(items[6].text())
+            k1 = float(items[7].text())
 
             result = self.calculator.calculate(
                 velocity=v, depth=d, safety_factor=sf,
@@ -305,31 +473,39 @@ class ComparisonTab(QWidget):
             )
 
             # Update results
-            self.table.item(row, 8).setText(f"{result.d30:.1f}")
-            self.table.item(row, 9).setText(f"{result.d50:.1f}")
-            self.table.item(row, 10).setText(f"{result.mass_d50:.1f}")
-
-            # Status
-            status_item = self.table.item(row, 11)
-            if result.froude_number > 1.2:
-                status_item.setText("LIMITE")
-            else:
-                status_item.setText("OK")
+            for col, text in enumerate(_result_cells(result), 8):
+                items[col].setText(text)
 
             # Store result
-            while len(self.scenarios) <= row:
-                self.scenarios.append(None)
-            self.scenarios[row] = result
+            self._store_scenario(row, result)
 
             # Apply colors
-            self.update_table_colors()
+            self._apply_row_colors(row)
 
-        except (ValueError, AttributeError):
+        except (ValueError, IndexError):
             pass  # Invalid input, skip calculation
 
+    def _store_scenario(self, row: int, result: MaynordResult):
+        """Remember the calculated result of a row"""
+        while len(self.scenarios) <= row:
+            self.scenarios.append(None)
+        self.scenarios[row] = ScenarioRow(result, result.status_ok)
+        self._valid_results = None
+
+    def _get_valid_results(self) -> list:
+        """Results of the calculated rows, shared by chart and summary"""
+        if self._valid_results is None:
+            self._valid_results = [s.result for s in self.scenarios if s is not None]
+        return self._valid_results
+
     def update_chart(self):
         """Update the comparison chart"""
-        valid_results = [r for r in self.scenarios if r is not None]
+        if not (self._chart or self._chart_placeholder).isVisible():
+            self._chart_dirty = True
+            return
+        self._chart_dirty = False
+
+        valid_results = self._get_valid_results()
         if valid_results:
             self.chart.update_comparison(valid_results)
         else:
@@ -337,7 +513,12 @@ class ComparisonTab(QWidget):
 
     def update_summary(self):
         """Update the comparison summary statistics"""
-        valid_results = [r for r in self.scenarios if r is not None]
+        if not self.summary_frame.isVisible():
+            self._summary_dirty = True
+            return
+        self._summary_dirty = False
+
+        valid_results = self._get_valid_results()
 
         if not valid_results:
             self.min_d30_label.setText("D30 min: --")
@@ -374,50 +555,59 @@ class ComparisonTab(QWidget):
         if not filename:
             return
 
-        try:
-            import openpyxl
-            wb = openpyxl.load_workbook(filename)
-            ws = wb.active
-
-            # Clear existing
-            self.table.setRowCount(0)
-            self.scenarios = []
-
-            # Read rows (skip header)
-            for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 1):
-                if not row[0]:  # Skip empty rows
-                    continue
-
-                self.add_scenario()
-                table_row = self.table.rowCount() - 1
-
-                # Map Excel columns to table columns
-                # Expecting: Description, V, D, SF, Cs, Cv, K1
-                if len(row) >= 7:
-                    self.table.item(table_row, 1).setText(str(row[0] or f"Scenario {row_idx}"))
-                    self.table.item(table_row, 2).setText(str(row[1] or "2.0"))
-                    self.table.item(table_row, 3).setText(str(row[2] or "1.5"))
-                    self.table.item(table_row, 4).setText(str(row[3] or "1.1"))
-                    self.table.item(table_row, 5).setText(str(row[4] or "0.375"))
-                    self.table.item(table_row, 6).setText(str(row[5] or "1.0"))
-                    self.table.item(table_row, 7).setText(str(row[6] or "1.0"))
-
-                self.calculate_row(table_row)
-
-            self.update_chart()
-            self.update_summary()
-            QMessageBox.information(self, "Import", f"{self.table.rowCount()} scenarios importes")
+        # Read and calculate in a worker thread, fill the table when done
+        self.import_btn.setEnabled(False)
+        self._import_thread = QThread(self)
+        self._import_worker = _ImportWorker(filename)
+        self._import_worker.moveToThread(self._import_thread)
+        self._import_thread.started.connect(self._import_worker.run)
+        self._import_worker.finished.connect(self._apply_import_results)
+        self._import_worker.failed.connect(self._on_import_failed)
+        self._import_worker.finished.connect(self._import_thread.quit)
+        self._import_worker.failed.connect(self._import_thread.quit)
+        self._import_thread.finished.connect(self._import_worker.deleteLater)
+        self._import_thread.finished.connect(self._import_thread.deleteLater)
+        self._import_thread.start()
+
+    @Slot(list)
+    def _apply_import_results(self, parsed: list):
+        """Replace the table content with the imported scenarios"""
+        with self._batch_table_updates():
+            self._clear_rows()
+            self.table.setRowCount(len(parsed))
+
+            for table_row, (values, result) in enumerate(parsed):
+                if result is not None:
+                    self._store_scenario(table_row, result)
+                self._set_row_items(table_row, values)
+
+        self.table.resizeColumnsToContents()
+        self.update_chart()
+        self.update_summary()
+        self.import_btn.setEnabled(True)
+        QMessageBox.information(self, "Import", f"{self.table.rowCount()} scenarios importes")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Erreur", f"Erreur d'import: {e}")
+    @Slot(str)
+    def _on_import_failed(self, message: str):
+        self.import_btn.setEnabled(True)
+        QMessageBox.critical(self, "Erreur", f"Erreur d'import: {message}")
 
     def clear_scenarios(self):
         """Clear all scenarios"""
-        self.table.setRowCount(0)
-        self.scenarios = []
-        self.chart.clear()
+        self._clear_rows()
+        self.update_chart()
         self.update_summary()
 
+    def _clear_rows(self):
+        """Drop all rows with their pending edits and cached row data"""
+        self._recalc_timer.stop()
+        self._dirty_rows.clear()
+        with self._batch_table_updates():
+            self.table.setRowCount(0)
+        self.scenarios = []
+        self._valid_results = None
+        self._row_items = []
+
     def refresh_labels(self):
         """Refresh labels after language change"""
         self.add_btn.setText("+ Scenario")
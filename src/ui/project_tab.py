@@ -5,17 +5,84 @@ Project Tab - Project management and history
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QTextEdit, QGroupBox,
-    QListWidget, QListWidgetItem, QPushButton
+    QListView, QPushButton
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSignalBlocker
+from collections import ChainMap
+from contextlib import contextmanager
 from datetime import datetime
 
-from resources.translations import tr
+from resources.translations import tr_section
+
+
+class _HistoryModel(QAbstractListModel):
+    """Calculation history of the project, formatted on demand
+
+    Rows come from a snapshot of the project's calculations taken by reload(),
+    so the view never sees the list change (or get replaced) behind its back.
+    """
+
+    def __init__(self, project_manager, parent=None):
+        super().__init__(parent)
+        self.project_manager = project_manager
+        self._calculations = list(project_manager.project.calculations)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._calculations)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        calc = self._calculations[index.row()]
+        if role == Qt.DisplayRole:
+            timestamp = calc.get('timestamp', 'N/A')
+            v = calc.get('velocity', 0)
+            d = calc.get('depth', 0)
+            d30 = calc.get('result', {}).get('d30_mm', 0)
+            return f"#{index.row()+1} | V={v}m/s D={d}m → D30={d30:.0f}mm | {timestamp}"
+        if role == Qt.UserRole:
+            return calc
+        return None
+
+    def reload(self):
+        """Snapshot the project's calculations and notify views"""
+        self.beginResetModel()
+        self._calculations = list(self.project_manager.project.calculations)
+        self.endResetModel()
+
+
+class _DetailFields(ChainMap):
+    """Lookup for the details template, 'N/A' for missing values"""
+
+    def __missing__(self, key):
+        return 'N/A'
 
 
 class ProjectTab(QWidget):
     """Tab for project management"""
 
+    # Selected calculation details, filled with format_map(_DetailFields)
+    _DETAILS_TMPL = """
+<b>Paramètres d'entrée:</b><br>
+• Vitesse: {velocity} m/s<br>
+• Profondeur: {depth} m<br>
+<br>
+<b>Coefficients:</b><br>
+• SF: {SF}<br>
+• Cs: {Cs}<br>
+• Cv: {Cv}<br>
+• K1: {K1}<br>
+<br>
+<b>Résultats:</b><br>
+• D30: {d30_mm} mm<br>
+• D50: {d50_mm} mm<br>
+• D100: {d100_mm} mm<br>
+• Épaisseur: {thickness_cm} cm<br>
+• Froude: {froude}<br>
+            """
+
     def __init__(self, project_manager):
         super().__init__()
         self.project_manager = project_manager
@@ -32,33 +99,35 @@ class ProjectTab(QWidget):
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(15)
 
+        labels = tr_section('project')
+
         # Left panel - Project info
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
 
         # Project details group
-        info_group = QGroupBox(tr('project.title'))
+        info_group = QGroupBox(labels['title'])
         info_layout = QGridLayout(info_group)
 
-        info_layout.addWidget(QLabel(tr('project.name')), 0, 0)
+        info_layout.addWidget(QLabel(labels['name']), 0, 0)
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Nom du projet")
         self.name_edit.textChanged.connect(self.on_info_changed)
         info_layout.addWidget(self.name_edit, 0, 1)
 
-        info_layout.addWidget(QLabel(tr('project.engineer')), 1, 0)
+        info_layout.addWidget(QLabel(labels['engineer']), 1, 0)
         self.engineer_edit = QLineEdit()
         self.engineer_edit.setPlaceholderText("Nom de l'ingénieur")
         self.engineer_edit.textChanged.connect(self.on_info_changed)
         info_layout.addWidget(self.engineer_edit, 1, 1)
 
-        info_layout.addWidget(QLabel(tr('project.date')), 2, 0)
+        info_layout.addWidget(QLabel(labels['date']), 2, 0)
         self.date_edit = QLineEdit()
         self.date_edit.setText(datetime.now().strftime("%Y-%m-%d"))
         self.date_edit.textChanged.connect(self.on_info_changed)
         info_layout.addWidget(self.date_edit, 2, 1)
 
-        info_layout.addWidget(QLabel(tr('project.location')), 3, 0)
+        info_layout.addWidget(QLabel(labels['location']), 3, 0)
         self.location_edit = QLineEdit()
         self.location_edit.setPlaceholderText("Localisation du projet")
         self.location_edit.textChanged.connect(self.on_info_changed)
@@ -67,7 +136,7 @@ class ProjectTab(QWidget):
         left_layout.addWidget(info_group)
 
         # Notes group
-        notes_group = QGroupBox(tr('project.notes'))
+        notes_group = QGroupBox(labels['notes'])
         notes_layout = QVBoxLayout(notes_group)
         self.notes_edit = QTextEdit()
         self.notes_edit.setPlaceholderText("Notes et commentaires...")
@@ -81,11 +150,14 @@ class ProjectTab(QWidget):
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
 
-        history_group = QGroupBox(tr('project.history'))
+        history_group = QGroupBox(labels['history'])
         history_layout = QVBoxLayout(history_group)
 
-        self.history_list = QListWidget()
-        self.history_list.itemClicked.connect(self.on_history_clicked)
+        self.history_model = _HistoryModel(self.project_manager, self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.clicked.connect(self.on_history_clicked)
         history_layout.addWidget(self.history_list)
 
         # History buttons
@@ -125,67 +197,42 @@ class ProjectTab(QWidget):
         project.notes = self.notes_edit.toPlainText()
         self.project_manager.is_modified = True
 
+    @contextmanager
+    def _block_info_signals(self):
+        """Block the project info editors' signals (released even on error)"""
+        widgets = [
+            self.name_edit, self.engineer_edit, self.date_edit,
+            self.location_edit, self.notes_edit,
+        ]
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
     def refresh(self):
         """Refresh project data"""
         project = self.project_manager.project
 
         # Block signals to prevent triggering on_info_changed
-        self.name_edit.blockSignals(True)
-        self.engineer_edit.blockSignals(True)
-        self.date_edit.blockSignals(True)
-        self.location_edit.blockSignals(True)
-        self.notes_edit.blockSignals(True)
-
-        self.name_edit.setText(project.name or "")
-        self.engineer_edit.setText(project.engineer or "")
-        self.date_edit.setText(project.date or datetime.now().strftime("%Y-%m-%d"))
-        self.location_edit.setText(project.location or "")
-        self.notes_edit.setPlainText(project.notes or "")
-
-        self.name_edit.blockSignals(False)
-        self.engineer_edit.blockSignals(False)
-        self.date_edit.blockSignals(False)
-        self.location_edit.blockSignals(False)
-        self.notes_edit.blockSignals(False)
-
-        # Refresh history
-        self.history_list.clear()
-        for i, calc in enumerate(project.calculations):
-            timestamp = calc.get('timestamp', 'N/A')
-            v = calc.get('velocity', 0)
-            d = calc.get('depth', 0)
-            d30 = calc.get('result', {}).get('d30_mm', 0)
+        with self._block_info_signals():
+            self.name_edit.setText(project.name or "")
+            self.engineer_edit.setText(project.engineer or "")
+            self.date_edit.setText(project.date or datetime.now().strftime("%Y-%m-%d"))
+            self.location_edit.setText(project.location or "")
+            self.notes_edit.setPlainText(project.notes or "")
 
-            item = QListWidgetItem(f"#{i+1} | V={v}m/s D={d}m → D30={d30:.0f}mm | {timestamp}")
-            item.setData(Qt.UserRole, calc)
-            self.history_list.addItem(item)
+        # Refresh history (rows are formatted by the model when displayed)
+        self.history_model.reload()
 
-    def on_history_clicked(self, item):
+    def on_history_clicked(self, index):
         """Show details of selected calculation"""
-        calc = item.data(Qt.UserRole)
+        calc = index.data(Qt.UserRole)
         if calc:
-            result = calc.get('result', {})
-            coeffs = calc.get('coefficients', {})
-
-            details = f"""
-<b>Paramètres d'entrée:</b><br>
-• Vitesse: {calc.get('velocity', 'N/A')} m/s<br>
-• Profondeur: {calc.get('depth', 'N/A')} m<br>
-<br>
-<b>Coefficients:</b><br>
-• SF: {coeffs.get('SF', 'N/A')}<br>
-• Cs: {coeffs.get('Cs', 'N/A')}<br>
-• Cv: {coeffs.get('Cv', 'N/A')}<br>
-• K1: {coeffs.get('K1', 'N/A')}<br>
-<br>
-<b>Résultats:</b><br>
-• D30: {result.get('d30_mm', 'N/A')} mm<br>
-• D50: {result.get('d50_mm', 'N/A')} mm<br>
-• D100: {result.get('d100_mm', 'N/A')} mm<br>
-• Épaisseur: {result.get('thickness_cm', 'N/A')} cm<br>
-• Froude: {result.get('froude', 'N/A')}<br>
-            """
-            self.details_label.setText(details)
+            fields = _DetailFields(
+                calc.get('result', {}), calc.get('coefficients', {}), calc)
+            self.details_label.setText(self._DETAILS_TMPL.format_map(fields))
             self.details_label.setStyleSheet("color: #1e293b;")
 
     def export_history(self):
@@ -196,7 +243,7 @@ class ProjectTab(QWidget):
     def clear_history(self):
         """Clear calculation history"""
         self.project_manager.project.calculations = []
-        self.history_list.clear()
+        self.history_model.reload()
         self.details_label.setText("Sélectionnez un calcul dans l'historique")
         self.details_label.setStyleSheet("color: #64748b;")
 
@@ -3,6 +3,7 @@ Settings Dialog with Easter Egg
 """
 
 import os
+import time
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QComboBox, QSpinBox, QGroupBox,
@@ -10,59 +11,96 @@ from PySide6.QtWidgets import (
     QFrame
 )
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPixmap, QImage, QColor
+from PySide6.QtGui import QPixmap, QPixmapCache, QColor
 
 from resources.translations import tr, set_language, get_language, Language
 
+# Bundled icons (src/resources/icons, added as data by BUILD.bat)
+_ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "icons")
+
 
 class ClickableLabel(QLabel):
     """Label that tracks consecutive clicks"""
 
+    # Clicks further apart than this (seconds) restart the count
+    CLICK_WINDOW = 1.0
+
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self.click_count = 0
-        self.click_timer = QTimer()
-        self.click_timer.timeout.connect(self.reset_clicks)
-        self.click_timer.setSingleShot(True)
+        self._last_click = 0.0
         self.on_easter_egg = None
         self.setCursor(Qt.PointingHandCursor)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            now = time.monotonic()
+            if now - self._last_click > self.CLICK_WINDOW:
+                self.click_count = 0
             self.click_count += 1
-            self.click_timer.start(1500)  # Reset after 1.5s of no clicks
+            self._last_click = now
 
             if self.click_count >= 7 and self.on_easter_egg:
                 self.on_easter_egg()
                 self.click_count = 0
         super().mousePressEvent(event)
 
-    def reset_clicks(self):
-        self.click_count = 0
-
 
 class SettingsDialog(QDialog):
     """Settings dialog with Easter egg"""
 
     def __init__(self, parent=None, current_theme="light"):
         super().__init__(parent)
+        # Build and style the dialog with updates off, painted once when shown
+        self.setUpdatesEnabled(False)
         self.current_theme = current_theme
         self.easter_egg_active = False
+        self._applied_theme = None
         self.setWindowTitle(tr('settings.title'))
         self.setMinimumWidth(450)
-        self.setup_ui()
+        # Stylesheet set before the children exist: they are styled as they
+        # are polished instead of being restyled afterwards
         self.apply_theme()
+        self.setup_ui()
+        self.setUpdatesEnabled(True)
 
     def setup_ui(self):
         """Setup the dialog UI"""
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
 
-        tabs = QTabWidget()
+        # Tab contents are built the first time each tab is shown
+        self.tabs = QTabWidget()
+        self._tab_builders = {}
+        for title, builder in (
+            ("General", self._build_general_tab),
+            ("Valeurs par defaut", self._build_defaults_tab),
+            ("A propos", self._build_about_tab),
+        ):
+            index = self.tabs.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        self._on_tab_changed(0)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        layout.addWidget(self.tabs)
 
-        # General tab
-        general_tab = QWidget()
-        general_layout = QVBoxLayout(general_tab)
+        # Buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def _on_tab_changed(self, index: int):
+        """Build the contents of a tab on its first display"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder(self.tabs.widget(index))
+
+    def _build_general_tab(self, tab: QWidget):
+        """General tab: language and precision"""
+        general_layout = QVBoxLayout(tab)
         general_layout.setSpacing(15)
 
         # Language
@@ -99,11 +137,9 @@ class SettingsDialog(QDialog):
         general_layout.addWidget(precision_group)
         general_layout.addStretch()
 
-        tabs.addTab(general_tab, "General")
-
-        # Defaults tab
-        defaults_tab = QWidget()
-        defaults_layout = QVBoxLayout(defaults_tab)
+    def _build_defaults_tab(self, tab: QWidget):
+        """Default values tab"""
+        defaults_layout = QVBoxLayout(tab)
         defaults_layout.setSpacing(15)
 
         defaults_group = QGroupBox(tr('settings.default_values'))
@@ -130,11 +166,9 @@ class SettingsDialog(QDialog):
         defaults_layout.addWidget(defaults_group)
         defaults_layout.addStretch()
 
-        tabs.addTab(defaults_tab, "Valeurs par defaut")
-
-        # About tab
-        about_tab = QWidget()
-        about_layout = QVBoxLayout(about_tab)
+    def _build_about_tab(self, tab: QWidget):
+        """About tab with credits (and Easter egg)"""
+        about_layout = QVBoxLayout(tab)
         about_layout.setSpacing(15)
 
         # App info
@@ -180,6 +214,8 @@ class SettingsDialog(QDialog):
         self.easter_egg_image.setScaledContents(False)
         self.easter_egg_image.hide()
         credits_layout.addWidget(self.easter_egg_image)
+        # Load and scale the image once the tab is shown, not on the click
+        QTimer.singleShot(0, self._easter_egg_pixmap)
 
         # Easter egg title (hidden by default)
         self.easter_egg_title = QLabel("<h1 style='color: #f59e0b;'>LORD Z</h1>")
@@ -202,17 +238,20 @@ class SettingsDialog(QDialog):
         about_layout.addWidget(credits_frame)
         about_layout.addStretch()
 
-        tabs.addTab(about_tab, "A propos")
-
-        layout.addWidget(tabs)
-
-        # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
-        )
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+    def _easter_egg_pixmap(self):
+        """Scaled Lord Z pixmap for the current theme (kept in QPixmapCache)"""
+        key = f"lord_z:{self.current_theme}:180"
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            # Dark mode uses a pre-inverted copy (white lines)
+            icon_name = "lord_z_dark.png" if self.current_theme == "dark" else "lord_z.png"
+            pixmap = QPixmap(os.path.join(_ICONS_DIR, icon_name))
+            if not pixmap.isNull():  # Null if the icon is missing
+                # Scale to reasonable size while keeping aspect ratio
+                # Use a larger size to avoid cropping
+                scaled = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(key, scaled)
+        return scaled
 
     def show_easter_egg(self):
         """Show the Lord Z Easter egg"""
@@ -225,22 +264,8 @@ class SettingsDialog(QDialog):
         self.credit_label.hide()
 
         # Load and show image
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)),
-                                 "resources", "icons", "lord_z.png")
-
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-
-            # If dark mode, invert the black lines to white
-            if self.current_theme == "dark":
-                image = pixmap.toImage()
-                # Invert colors for visibility in dark mode
-                image.invertPixels()
-                pixmap = QPixmap.fromImage(image)
-
-            # Scale to reasonable size while keeping aspect ratio
-            # Use a larger size to avoid cropping
-            scaled = pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled = self._easter_egg_pixmap()
+        if scaled is not None:
             self.easter_egg_image.setPixmap(scaled)
             self.easter_egg_image.setFixedSize(scaled.size())
             self.easter_egg_image.show()
@@ -253,166 +278,16 @@ class SettingsDialog(QDialog):
 
     def apply_theme(self):
         """Apply theme styling"""
+        if self._applied_theme == self.current_theme:
+            return
+        self._applied_theme = self.current_theme
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
         if self.current_theme == "dark":
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #1e293b;
-                    color: #e2e8f0;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #334155;
-                    background-color: #1e293b;
-                }
-                QTabBar::tab {
-                    background-color: #334155;
-                    color: #e2e8f0;
-                    padding: 8px 16px;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #2563eb;
-                    color: white;
-                }
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #334155;
-                    border-radius: 6px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    background-color: #0f172a;
-                    color: #e2e8f0;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                    color: #60a5fa;
-                }
-                QLabel {
-                    color: #e2e8f0;
-                }
-                QComboBox, QSpinBox {
-                    background-color: #334155;
-                    color: #e2e8f0;
-                    border: 1px solid #475569;
-                    border-radius: 4px;
-                    padding: 5px;
-                    min-width: 100px;
-                }
-                QComboBox:hover, QSpinBox:hover {
-                    border-color: #60a5fa;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #334155;
-                    color: #e2e8f0;
-                    selection-background-color: #2563eb;
-                }
-                QPushButton {
-                    background-color: #334155;
-                    color: #e2e8f0;
-                    border: 1px solid #475569;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #475569;
-                    border-color: #60a5fa;
-                }
-                QPushButton:pressed {
-                    background-color: #2563eb;
-                }
-                QFrame#creditsFrame, QFrame#refsFrame {
-                    background-color: #0f172a;
-                    border: 1px solid #334155;
-                    border-radius: 8px;
-                    padding: 15px;
-                }
-            """)
+            self.setStyleSheet(DIALOG_DARK_THEME)
         else:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #f8fafc;
-                    color: #1e293b;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #e2e8f0;
-                    background-color: #ffffff;
-                }
-                QTabBar::tab {
-                    background-color: #e2e8f0;
-                    color: #334155;
-                    padding: 8px 16px;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #2563eb;
-                    color: white;
-                }
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #e2e8f0;
-                    border-radius: 6px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    background-color: #ffffff;
-                    color: #1e293b;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                    color: #2563eb;
-                }
-                QLabel {
-                    color: #334155;
-                }
-                QComboBox, QSpinBox {
-                    background-color: #ffffff;
-                    color: #1e293b;
-                    border: 1px solid #cbd5e1;
-                    border-radius: 4px;
-                    padding: 5px;
-                    min-width: 100px;
-                }
-                QComboBox:hover, QSpinBox:hover {
-                    border-color: #2563eb;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #ffffff;
-                    color: #1e293b;
-                    selection-background-color: #2563eb;
-                    selection-color: white;
-                }
-                QPushButton {
-                    background-color: #e2e8f0;
-                    color: #334155;
-                    border: 1px solid #cbd5e1;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #cbd5e1;
-                    border-color: #2563eb;
-                }
-                QPushButton:pressed {
-                    background-color: #2563eb;
-                    color: white;
-                }
-                QFrame#creditsFrame, QFrame#refsFrame {
-                    background-color: #ffffff;
-                    border: 1px solid #e2e8f0;
-                    border-radius: 8px;
-                    padding: 15px;
-                }
-            """)
+            self.setStyleSheet(DIALOG_LIGHT_THEME)
+        self.setUpdatesEnabled(updates_enabled)
 
     def accept(self):
         """Save settings and close"""
@@ -421,3 +296,166 @@ class SettingsDialog(QDialog):
         set_language(lang)
 
         super().accept()
+
+
+# ============== THEMES ==============
+
+DIALOG_LIGHT_THEME = """
+QDialog {
+    background-color: #f8fafc;
+    color: #1e293b;
+}
+QTabWidget::pane {
+    border: 1px solid #e2e8f0;
+    background-color: #ffffff;
+}
+QTabBar::tab {
+    background-color: #e2e8f0;
+    color: #334155;
+    padding: 8px 16px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+QTabBar::tab:selected {
+    background-color: #2563eb;
+    color: white;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #e2e8f0;
+    border-radius: 6px;
+    margin-top: 10px;
+    padding-top: 10px;
+    background-color: #ffffff;
+    color: #1e293b;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+    color: #2563eb;
+}
+QLabel {
+    color: #334155;
+}
+QComboBox, QSpinBox {
+    background-color: #ffffff;
+    color: #1e293b;
+    border: 1px solid #cbd5e1;
+    border-radius: 4px;
+    padding: 5px;
+    min-width: 100px;
+}
+QComboBox:hover, QSpinBox:hover {
+    border-color: #2563eb;
+}
+QComboBox::drop-down {
+    border: none;
+}
+QComboBox QAbstractItemView {
+    background-color: #ffffff;
+    color: #1e293b;
+    selection-background-color: #2563eb;
+    selection-color: white;
+}
+QPushButton {
+    background-color: #e2e8f0;
+    color: #334155;
+    border: 1px solid #cbd5e1;
+    border-radius: 4px;
+    padding: 8px 16px;
+}
+QPushButton:hover {
+    background-color: #cbd5e1;
+    border-color: #2563eb;
+}
+QPushButton:pressed {
+    background-color: #2563eb;
+    color: white;
+}
+QFrame#creditsFrame, QFrame#refsFrame {
+    background-color: #ffffff;
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+    padding: 15px;
+}
+"""
+
+DIALOG_DARK_THEME = """
+QDialog {
+    background-color: #1e293b;
+    color: #e2e8f0;
+}
+QTabWidget::pane {
+    border: 1px solid #334155;
+    background-color: #1e293b;
+}
+QTabBar::tab {
+    background-color: #334155;
+    color: #e2e8f0;
+    padding: 8px 16px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+QTabBar::tab:selected {
+    background-color: #2563eb;
+    color: white;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #334155;
+    border-radius: 6px;
+    margin-top: 10px;
+    padding-top: 10px;
+    background-color: #0f172a;
+    color: #e2e8f0;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+    color: #60a5fa;
+}
+QLabel {
+    color: #e2e8f0;
+}
+QComboBox, QSpinBox {
+    background-color: #334155;
+    color: #e2e8f0;
+    border: 1px solid #475569;
+    border-radius: 4px;
+    padding: 5px;
+    min-width: 100px;
+}
+QComboBox:hover, QSpinBox:hover {
+    border-color: #60a5fa;
+}
+QComboBox::drop-down {
+    border: none;
+}
+QComboBox QAbstractItemView {
+    background-color: #334155;
+    color: #e2e8f0;
+    selection-background-color: #2563eb;
+}
+QPushButton {
+    background-color: #334155;
+    color: #e2e8f0;
+    border: 1px solid #475569;
+    border-radius: 4px;
+    padding: 8px 16px;
+}
+QPushButton:hover {
+    background-color: #475569;
+    border-color: #60a5fa;
+}
+QPushButton:pressed {
+    background-color: #2563eb;
+}
+QFrame#creditsFrame, QFrame#refsFrame {
+    background-color: #0f172a;
+    border: 1px solid #334155;
+    border-radius: 8px;
+    padding: 15px;
+}
+"""
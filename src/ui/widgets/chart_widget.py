@@ -5,14 +5,48 @@ Chart Widget - Gradation curve visualization (Enhanced)
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from PySide6.QtCore import Qt
 
-import matplotlib
-matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
-
 from core.maynord import MaynordResult
 
+# Chart colors per theme
+_LIGHT_COLORS = {
+    'bg': '#ffffff',
+    'plot_bg': '#f8fafc',
+    'text': '#334155',
+    'grid': '#e2e8f0',
+    'line': '#2563eb',
+    'd30': '#16a34a',
+    'd50': '#d97706',
+    'd100': '#dc2626',
+}
+
+_DARK_COLORS = {
+    'bg': '#1e293b',
+    'plot_bg': '#0f172a',
+    'text': '#cbd5e1',
+    'grid': '#334155',
+    'line': '#0ea5e9',
+    'd30': '#22c55e',
+    'd50': '#f59e0b',
+    'd100': '#ef4444',
+}
+
+# Annotation box styles per theme and marker
+_ANNOTATION_BBOXES = {
+    theme: {
+        key: dict(boxstyle="round,pad=0.2", facecolor=colors['bg'],
+                  edgecolor=colors[key], alpha=0.95)
+        for key in ('d30', 'd50', 'd100')
+    }
+    for theme, colors in (("light", _LIGHT_COLORS), ("dark", _DARK_COLORS))
+}
+
+# Log x-axis tick positions (diameters in mm, 1 mm to 100 m)
+_MAJOR_TICKS = [10**d for d in range(6)]
+_MINOR_TICKS = [i * 10**d for d in range(5) for i in range(2, 10)]
+
+# Lower bound of the area under the gradation curve (5 points)
+_ZEROS5 = (0.0,) * 5
+
 
 class GradationChart(QWidget):
     """Widget displaying gradation curve"""
@@ -22,10 +56,21 @@ class GradationChart(QWidget):
         self.current_theme = "light"
         self.last_result = None  # Store last result for theme changes
         self.last_results = []   # Store comparison results
+        # Axes are created once; data artists are updated in place
+        self._mode = None              # "empty", "single" or "comparison"
+        self._single_artists = None    # Artists of the single-result curve
+        self._comparison_artists = []  # Artists of the comparison curves
         self.setup_ui()
 
     def setup_ui(self):
         """Setup the chart widget"""
+        # Matplotlib is imported with the first chart, not at app startup
+        import matplotlib
+        matplotlib.use('QtAgg')
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import FixedLocator
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -33,13 +78,22 @@ class GradationChart(QWidget):
         self.figure = Figure(figsize=(6, 4), dpi=100, constrained_layout=True)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_xscale('log')
+        # Fixed decade/sub-decade ticks instead of re-running LogLocator per draw
+        self.ax.xaxis.set_major_locator(FixedLocator(_MAJOR_TICKS))
+        self.ax.xaxis.set_minor_locator(FixedLocator(_MINOR_TICKS))
 
         layout.addWidget(self.canvas)
         self.init_chart()
 
     def set_theme(self, theme: str):
         """Set the chart theme and redraw with existing data"""
+        if theme == self.current_theme:
+            return
         self.current_theme = theme
+        # Artists are recreated with the new colors
+        self._mode = None
         # Redraw with existing data
         if self.last_results:
             self.update_comparison(self.last_results)
@@ -50,78 +104,73 @@ class GradationChart(QWidget):
 
     def _get_theme_colors(self):
         """Get colors based on current theme"""
-        if self.current_theme == "dark":
-            return {
-                'bg': '#1e293b',
-                'plot_bg': '#0f172a',
-                'text': '#cbd5e1',
-                'grid': '#334155',
-                'line': '#0ea5e9',
-                'd30': '#22c55e',
-                'd50': '#f59e0b',
-                'd100': '#ef4444',
-            }
-        else:
-            return {
-                'bg': '#ffffff',
-                'plot_bg': '#f8fafc',
-                'text': '#334155',
-                'grid': '#e2e8f0',
-                'line': '#2563eb',
-                'd30': '#16a34a',
-                'd50': '#d97706',
-                'd100': '#dc2626',
-            }
+        return _DARK_COLORS if self.current_theme == "dark" else _LIGHT_COLORS
 
-    def init_chart(self):
-        """Initialize empty chart"""
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
-        colors = self._get_theme_colors()
+    def _set_mode(self, mode: str):
+        """Switch display mode: drop the data artists and restyle the axes"""
+        if mode == self._mode:
+            return
+        self._mode = mode
+        self._remove_data_artists()
 
+        colors = self._get_theme_colors()
         self.figure.patch.set_facecolor(colors['bg'])
         self.ax.set_facecolor(colors['plot_bg'])
 
         self.ax.set_xlabel('Diametre (mm)', fontsize=10, color=colors['text'], fontweight='bold')
         self.ax.set_ylabel('Passant cumule (%)', fontsize=10, color=colors['text'], fontweight='bold')
+
+        # Grid and tick colors
+        if mode == "comparison":
+            self.ax.grid(True, which='both', linestyle='--', alpha=0.3, color=colors['grid'])
+            self.ax.tick_params(colors=colors['text'], which='both', labelsize=9)
+        else:
+            self.ax.grid(True, which='major', linestyle='-', alpha=0.3, color=colors['grid'])
+            self.ax.grid(True, which='minor', linestyle=':', alpha=0.2, color=colors['grid'])
+            self.ax.tick_params(colors=colors['text'], which='both', labelsize=9)
+        for spine in self.ax.spines.values():
+            spine.set_color(colors['grid'])
+
+    def _remove_data_artists(self):
+        """Remove curves, annotations and legend from the axes"""
+        if self._single_artists:
+            for artist in self._single_artists.values():
+                artist.remove()
+            self._single_artists = None
+        for artist in self._comparison_artists:
+            artist.remove()
+        self._comparison_artists = []
+        legend = self.ax.get_legend()
+        if legend:
+            legend.remove()
+
+    def init_chart(self):
+        """Initialize empty chart"""
+        self._set_mode("empty")
+        colors = self._get_theme_colors()
+
         self.ax.set_title('Courbe granulometrique', fontsize=11, fontweight='bold',
                          color=colors['text'], pad=10)
 
-        self.ax.set_xscale('log')
         self.ax.set_xlim(10, 2000)
         self.ax.set_ylim(0, 100)
 
-        # Grid
-        self.ax.grid(True, which='major', linestyle='-', alpha=0.3, color=colors['grid'])
-        self.ax.grid(True, which='minor', linestyle=':', alpha=0.2, color=colors['grid'])
-
-        # Tick colors
-        self.ax.tick_params(colors=colors['text'], which='both', labelsize=9)
-        for spine in self.ax.spines.values():
-            spine.set_color(colors['grid'])
-
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def update_chart(self, result: MaynordResult):
         """Update chart with calculation results"""
+        # Same result already displayed (calculator returns cached results)
+        if self._mode == "single" and result is self.last_result:
+            return
         self.last_result = result
         self.last_results = []  # Clear comparison data
 
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
+        self._set_mode("single")
         colors = self._get_theme_colors()
 
-        self.figure.patch.set_facecolor(colors['bg'])
-        self.ax.set_facecolor(colors['plot_bg'])
-
-        # Setup axes with responsive font sizes
-        self.ax.set_xlabel('Diametre (mm)', fontsize=10, color=colors['text'], fontweight='bold')
-        self.ax.set_ylabel('Passant cumule (%)', fontsize=10, color=colors['text'], fontweight='bold')
         self.ax.set_title('Courbe granulometrique', fontsize=11, fontweight='bold',
                          color=colors['text'], pad=8)
 
-        self.ax.set_xscale('log')
-
         # Calculate gradation points
         d15 = result.d30 * 0.70
         d30 = result.d30
@@ -135,78 +184,80 @@ class GradationChart(QWidget):
         self.ax.set_xlim(x_min, x_max)
         self.ax.set_ylim(0, 105)
 
-        # Grid
-        self.ax.grid(True, which='major', linestyle='-', alpha=0.3, color=colors['grid'])
-        self.ax.grid(True, which='minor', linestyle=':', alpha=0.2, color=colors['grid'])
-
-        # Tick colors
-        self.ax.tick_params(colors=colors['text'], which='both', labelsize=9)
-        for spine in self.ax.spines.values():
-            spine.set_color(colors['grid'])
-
         # Data points
         diameters = [d15, d30, d50, d85, d100]
         percentages = [15, 30, 50, 85, 100]
 
-        # Plot gradation curve with markers
-        self.ax.plot(diameters, percentages, 'o-', color=colors['line'],
-                     linewidth=2.5, markersize=8, markerfacecolor='white',
-                     markeredgewidth=2, label='Gradation', zorder=5)
+        artists = self._single_artists
+        if artists is None:
+            artists = self._single_artists = self._create_single_artists(colors)
+        else:
+            artists['fill'].remove()
 
-        # Fill area under curve
-        self.ax.fill_between(diameters, [0]*5, percentages, alpha=0.15, color=colors['line'])
+        artists['line'].set_data(diameters, percentages)
 
-        # Vertical lines for key diameters
-        self.ax.axvline(x=d30, color=colors['d30'], linestyle='--', alpha=0.8, linewidth=1.5)
-        self.ax.axvline(x=d50, color=colors['d50'], linestyle='--', alpha=0.8, linewidth=1.5)
-        self.ax.axvline(x=d100, color=colors['d100'], linestyle='--', alpha=0.8, linewidth=1.5)
+        # Fill area under curve
+        artists['fill'] = self.ax.fill_between(diameters, _ZEROS5, percentages,
+                                               alpha=0.15, color=colors['line'])
+
+        # Vertical lines and annotations for key diameters
+        for key, d, pct, text_pos in (
+            ('d30', d30, 30, (d30*0.5, 20)),
+            ('d50', d50, 50, (d50*1.5, 60)),
+            ('d100', d100, 100, (d100*0.5, 90)),
+        ):
+            artists[f'{key}_line'].set_xdata([d, d])
+            annotation = artists[f'{key}_label']
+            annotation.set_text(f'{key.upper()}={d:.0f}')
+            annotation.xy = (d, pct)
+            annotation.set_position(text_pos)
+
+        self.canvas.draw_idle()
+
+    def _create_single_artists(self, colors: dict) -> dict:
+        """Create the curve, marker lines, annotations and legend of a single result"""
+        artists = {}
+
+        # Gradation curve with markers
+        artists['line'], = self.ax.plot([], [], 'o-', color=colors['line'],
+                                        linewidth=2.5, markersize=8, markerfacecolor='white',
+                                        markeredgewidth=2, label='Gradation', zorder=5)
 
         # Annotations with boxes - positioned to avoid overlaps
         bbox_bg = colors['bg']
-        bbox_props = dict(boxstyle="round,pad=0.2", facecolor=bbox_bg, edgecolor=colors['d30'], alpha=0.95)
-
-        self.ax.annotate(f'D30={d30:.0f}', xy=(d30, 30), xytext=(d30*0.5, 20),
-                        fontsize=9, color=colors['d30'], fontweight='bold',
-                        bbox=bbox_props,
-                        arrowprops=dict(arrowstyle='->', color=colors['d30'], alpha=0.7))
-
-        bbox_props['edgecolor'] = colors['d50']
-        self.ax.annotate(f'D50={d50:.0f}', xy=(d50, 50), xytext=(d50*1.5, 60),
-                        fontsize=9, color=colors['d50'], fontweight='bold',
-                        bbox=bbox_props,
-                        arrowprops=dict(arrowstyle='->', color=colors['d50'], alpha=0.7))
-
-        bbox_props['edgecolor'] = colors['d100']
-        self.ax.annotate(f'D100={d100:.0f}', xy=(d100, 100), xytext=(d100*0.5, 90),
-                        fontsize=9, color=colors['d100'], fontweight='bold',
-                        bbox=bbox_props,
-                        arrowprops=dict(arrowstyle='->', color=colors['d100'], alpha=0.7))
+        bboxes = _ANNOTATION_BBOXES["dark" if self.current_theme == "dark" else "light"]
+        for key in ('d30', 'd50', 'd100'):
+            artists[f'{key}_line'] = self.ax.axvline(x=1, color=colors[key], linestyle='--',
+                                                     alpha=0.8, linewidth=1.5)
+            artists[f'{key}_label'] = self.ax.annotate(
+                '', xy=(1, 0), xytext=(1, 0),
+                fontsize=9, color=colors[key], fontweight='bold',
+                bbox=bboxes[key],
+                arrowprops=dict(arrowstyle='->', color=colors[key], alpha=0.7))
 
         # Legend
-        self.ax.legend(loc='lower right', fontsize=9, framealpha=0.9,
-                      facecolor=bbox_bg, edgecolor=colors['grid'], labelcolor=colors['text'])
-
-        self.canvas.draw()
+        self.ax.legend(handles=[artists['line']], loc='lower right', fontsize=9, framealpha=0.9,
+                       facecolor=bbox_bg, edgecolor=colors['grid'], labelcolor=colors['text'])
+        return artists
 
     def update_comparison(self, results: list):
         """Update chart with multiple results for comparison"""
-        self.last_results = results
+        # Same scenarios already displayed
+        if (self._mode == "comparison" and len(results) == len(self.last_results)
+                and all(a is b for a, b in zip(results, self.last_results))):
+            return
+        self.last_results = list(results)
         self.last_result = None  # Clear single result
 
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
+        self._set_mode("comparison")
+        for artist in self._comparison_artists:
+            artist.remove()
+        self._comparison_artists = []
         colors = self._get_theme_colors()
 
-        self.figure.patch.set_facecolor(colors['bg'])
-        self.ax.set_facecolor(colors['plot_bg'])
-
-        self.ax.set_xlabel('Diametre (mm)', fontsize=10, color=colors['text'], fontweight='bold')
-        self.ax.set_ylabel('Passant cumule (%)', fontsize=10, color=colors['text'], fontweight='bold')
         self.ax.set_title(f'Comparaison ({len(results)} scenarios)', fontsize=11, fontweight='bold',
                          color=colors['text'], pad=8)
 
-        self.ax.set_xscale('log')
-
         # Calculate x limits from all results
         all_d100 = [r.d100 for r in results]
         all_d15 = [r.d30 * 0.70 for r in results]
@@ -215,15 +266,11 @@ class GradationChart(QWidget):
         self.ax.set_xlim(x_min, x_max)
         self.ax.set_ylim(0, 105)
 
-        self.ax.grid(True, which='both', linestyle='--', alpha=0.3, color=colors['grid'])
-        self.ax.tick_params(colors=colors['text'], labelsize=9)
-        for spine in self.ax.spines.values():
-            spine.set_color(colors['grid'])
-
         # Color palette for scenarios
         palette = ['#2563eb', '#16a34a', '#f59e0b', '#dc2626', '#8b5cf6',
                    '#ec4899', '#06b6d4', '#84cc16', '#f97316', '#6366f1']
 
+        curves = []
         for i, result in enumerate(results[:10]):
             d15 = result.d30 * 0.70
             d30 = result.d30
@@ -235,24 +282,26 @@ class GradationChart(QWidget):
             percentages = [15, 30, 50, 85, 100]
 
             color = palette[i % len(palette)]
-            self.ax.plot(diameters, percentages, 'o-', color=color,
-                        linewidth=2, markersize=5,
-                        label=f'S{i+1}: D30={d30:.0f} D50={d50:.0f}')
+            curves += self.ax.plot(diameters, percentages, 'o-', color=color,
+                                   linewidth=2, markersize=5,
+                                   label=f'S{i+1}: D30={d30:.0f} D50={d50:.0f}')
 
             # Add D50 marker annotation
-            self.ax.plot(d50, 50, 's', color=color, markersize=8,
-                        markerfacecolor='white', markeredgewidth=2)
+            self._comparison_artists += self.ax.plot(d50, 50, 's', color=color, markersize=8,
+                                                     markerfacecolor='white', markeredgewidth=2)
+        self._comparison_artists += curves
 
         # Legend with scenario info
-        self.ax.legend(loc='lower right', fontsize=8, framealpha=0.95,
+        self.ax.legend(handles=curves, loc='lower right', fontsize=8, framealpha=0.95,
                       facecolor=colors['bg'], edgecolor=colors['grid'],
                       labelcolor=colors['text'], ncol=1)
 
         # Add reference lines for percentiles
         for pct in [30, 50]:
-            self.ax.axhline(y=pct, color=colors['grid'], linestyle='-', alpha=0.5, linewidth=0.5)
+            self._comparison_artists.append(
+                self.ax.axhline(y=pct, color=colors['grid'], linestyle='-', alpha=0.5, linewidth=0.5))
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def clear(self):
         """Clear the chart and stored data"""
@@ -2,24 +2,56 @@
 Results Panel Widget - Responsive display of calculation results
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from core.maynord import MaynordResult
 from core.gradation import get_complete_gradation_summary
 from resources.translations import tr
 
 
+@lru_cache(maxsize=256)
+def _gradation_cached(d30_q: int, ss_q: int):
+    """Resume de gradation memoise sur des entrees quantifiees (d30 en 1/100 mm, Ss en 1/1000)"""
+    return get_complete_gradation_summary(d30_q / 100, ss_q / 1000)
+
+
+_FMT_CACHE = {}  # (decimales, valeur arrondie) -> texte, partage par tous les panneaux
+_FMT_CACHE_SIZE = 4096
+
+
+def _format_fixed(value: float, digits: int) -> str:
+    """f"{value:.{digits}f}", reusing strings already built for the same rounded value"""
+    # round() arrondit comme le format (demi-pair), donc la cle ne change pas le texte
+    key = (digits, round(value, digits))
+    text = _FMT_CACHE.get(key)
+    if text is None:
+        text = f"{key[1]:.{digits}f}"
+        if len(_FMT_CACHE) < _FMT_CACHE_SIZE:
+            _FMT_CACHE[key] = text
+    return text
+
+
 class ResultCard(QFrame):
-    """A card displaying a single result value"""
+    """A card displaying a single result value
 
-    def __init__(self, title: str, unit: str = "", color: str = "#1e40af"):
+    Styling comes from the application stylesheet: the title color is selected
+    through the card's "accent" property (blue, green, red, amber, purple, gray, sky).
+    """
+
+    def __init__(self, title: str, unit: str = "", accent: str = "blue"):
         super().__init__()
         self.setObjectName("resultCard")
-        self.color = color
+        self.setProperty("accent", accent)
+        self.accent = accent
+        self._last_value = "--"
+        self._last_unit = unit
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
@@ -27,23 +59,22 @@ class ResultCard(QFrame):
 
         # Title
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet(f"color: {color}; font-size: 11px; font-weight: bold;")
+        self.title_label.setObjectName("resultTitle")
+        self.title_label.setTextFormat(Qt.PlainText)
         layout.addWidget(self.title_label)
 
         # Value
         self.value_label = QLabel("--")
         self.value_label.setObjectName("resultValue")
-        self.value_label.setStyleSheet("""
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 20px;
-            font-weight: bold;
-        """)
+        # Texte numerique: pas de detection rich-text a chaque setText
+        self.value_label.setTextFormat(Qt.PlainText)
         layout.addWidget(self.value_label)
 
         # Unit
         if unit:
             self.unit_label = QLabel(unit)
-            self.unit_label.setStyleSheet("color: #64748b; font-size: 10px;")
+            self.unit_label.setObjectName("resultUnit")
+            self.unit_label.setTextFormat(Qt.PlainText)
             layout.addWidget(self.unit_label)
         else:
             self.unit_label = None
@@ -52,16 +83,102 @@ class ResultCard(QFrame):
 
     def set_value(self, value: str, unit: str = None):
         """Set the displayed value"""
-        self.value_label.setText(value)
-        if unit and self.unit_label:
+        # setText invalide le layout meme a texte identique: on compare d'abord
+        if value != self._last_value:
+            self.value_label.setText(value)
+            self._last_value = value
+        if unit and self.unit_label and unit != self._last_unit:
             self.unit_label.setText(unit)
+            self._last_unit = unit
 
 
 class ResultsPanel(QWidget):
     """Responsive panel displaying Maynord calculation results"""
 
+    _SECTIONS = (
+        ("diam", "DIAMETRES CARACTERISTIQUES"),
+        ("mass", "MASSES UNITAIRES"),
+        ("other", "AUTRES PARAMETRES"),
+    )
+
+    # (nom, (titre, unite, accent), section) -> self.<nom>_card / self.<nom>_label
+    _CARD_SPECS = (
+        ("d30", ("D30 (calcule)", "mm", "blue"), "diam"),
+        ("d50", ("D50 (estime)", "mm", "green"), "diam"),
+        ("d100", ("D100 (max)", "mm", "red"), "diam"),
+        ("mass_d30", ("Masse D30", "kg", "blue"), "mass"),
+        ("mass_d50", ("Masse D50", "kg", "green"), "mass"),
+        ("mass_d100", ("Masse D100", "kg", "red"), "mass"),
+        ("thickness", ("Epaisseur couche", "cm", "amber"), "other"),
+        ("class", ("Classe USACE", "", "purple"), "other"),
+        ("froude", ("Nombre Froude", "", "gray"), "other"),
+        ("mass_m2", ("Masse/surface", "kg/m²", "sky"), "other"),
+    )
+
+    # Styles du cadre d'avertissement / d'erreur
+    _WARN_FRAME_CSS = """
+        QFrame#warningsFrame {
+            background: #fef3c7;
+            border: 1px solid #f59e0b;
+            border-radius: 6px;
+        }
+    """
+    _WARN_LABEL_CSS = "color: #92400e; font-size: 12px;"
+    _ERROR_FRAME_CSS = """
+        QFrame#warningsFrame {
+            background: #fee2e2;
+            border: 1px solid #dc2626;
+            border-radius: 6px;
+        }
+    """
+    _ERROR_LABEL_CSS = "color: #dc2626; font-size: 12px;"
+
+    # Styles de l'indicateur de statut: (frame, icon, label), parses une seule fois
+    _STATUS_STYLES = {
+        "stable": ("""
+                QFrame {
+                    background: #dcfce7;
+                    border: 2px solid #16a34a;
+                    border-radius: 8px;
+                }
+            """,
+            "font-size: 18px; color: #16a34a;",
+            "font-size: 14px; font-weight: bold; color: #16a34a;"),
+        "warning": ("""
+                QFrame {
+                    background: #fef3c7;
+                    border: 2px solid #f59e0b;
+                    border-radius: 8px;
+                }
+            """,
+            "font-size: 18px; color: #f59e0b;",
+            "font-size: 14px; font-weight: bold; color: #d97706;"),
+        "error": ("""
+                QFrame {
+                    background: #fee2e2;
+                    border: 2px solid #dc2626;
+                    border-radius: 8px;
+                }
+            """,
+            "font-size: 18px; color: #dc2626;",
+            "font-size: 14px; font-weight: bold; color: #dc2626;"),
+        "waiting": ("""
+                QFrame {
+                    background: #f1f5f9;
+                    border: 2px solid #cbd5e1;
+                    border-radius: 8px;
+                }
+            """,
+            "font-size: 18px; color: #94a3b8;",
+            "font-size: 14px; font-weight: bold; color: #64748b;"),
+    }
+
     def __init__(self):
         super().__init__()
+        self._current_status = None
+        self._last_result_key = None
+        self._pending = None  # (methode, argument) differe tant que le panneau est cache
+        self._cleared = False  # clear() demande, applique au prochain tour de boucle
         self.setup_ui()
 
     def setup_ui(self):
@@ -107,204 +224,203 @@ class ResultsPanel(QWidget):
         results_layout.setSpacing(15)
         results_layout.setContentsMargins(15, 15, 15, 15)
 
-        # Section 1: Diameters (main results)
-        diam_section = QLabel("DIAMETRES CARACTERISTIQUES")
-        diam_section.setStyleSheet("color: #1e40af; font-weight: bold; font-size: 12px;")
-        results_layout.addWidget(diam_section)
-
-        diam_grid = QHBoxLayout()
-        diam_grid.setSpacing(15)
-
-        self.d30_card = ResultCard("D30 (calcule)", "mm", "#2563eb")
-        self.d50_card = ResultCard("D50 (estime)", "mm", "#16a34a")
-        self.d100_card = ResultCard("D100 (max)", "mm", "#dc2626")
-
-        diam_grid.addWidget(self.d30_card)
-        diam_grid.addWidget(self.d50_card)
-        diam_grid.addWidget(self.d100_card)
-        results_layout.addLayout(diam_grid)
-
-        # Section 2: Masses
-        mass_section = QLabel("MASSES UNITAIRES")
-        mass_section.setStyleSheet("color: #1e40af; font-weight: bold; font-size: 12px;")
-        results_layout.addWidget(mass_section)
-
-        mass_grid = QHBoxLayout()
-        mass_grid.setSpacing(15)
-
-        self.mass_d30_card = ResultCard("Masse D30", "kg", "#2563eb")
-        self.mass_d50_card = ResultCard("Masse D50", "kg", "#16a34a")
-        self.mass_d100_card = ResultCard("Masse D100", "kg", "#dc2626")
-
-        mass_grid.addWidget(self.mass_d30_card)
-        mass_grid.addWidget(self.mass_d50_card)
-        mass_grid.addWidget(self.mass_d100_card)
-        results_layout.addLayout(mass_grid)
-
-        # Section 3: Other results
-        other_section = QLabel("AUTRES PARAMETRES")
-        other_section.setStyleSheet("color: #1e40af; font-weight: bold; font-size: 12px;")
-        results_layout.addWidget(other_section)
-
-        other_grid = QHBoxLayout()
-        other_grid.setSpacing(15)
-
-        self.thickness_card = ResultCard("Epaisseur couche", "cm", "#f59e0b")
-        self.class_card = ResultCard("Classe USACE", "", "#8b5cf6")
-        self.froude_card = ResultCard("Nombre Froude", "", "#64748b")
-        self.mass_m2_card = ResultCard("Masse/surface", "kg/m²", "#0ea5e9")
-
-        other_grid.addWidget(self.thickness_card)
-        other_grid.addWidget(self.class_card)
-        other_grid.addWidget(self.froude_card)
-        other_grid.addWidget(self.mass_m2_card)
-        results_layout.addLayout(other_grid)
+        # Sections et cartes construites depuis _SECTIONS / _CARD_SPECS
+        self._all_cards = []
+        for section, section_title in self._SECTIONS:
+            section_label = QLabel(section_title)
+            section_label.setStyleSheet("color: #1e40af; font-weight: bold; font-size: 12px;")
+            results_layout.addWidget(section_label)
+
+            grid = QHBoxLayout()
+            grid.setSpacing(15)
+            for name, (title, unit, accent), card_section in self._CARD_SPECS:
+                if card_section != section:
+                    continue
+                card = ResultCard(title, unit, accent)
+                setattr(self, f"{name}_card", card)
+                # Label references kept for compatibility (self.d30_label, ...)
+                setattr(self, f"{name}_label", card.value_label)
+                # Setter pre-lie pour update_results (self._set_d30, ...)
+                setattr(self, f"_set_{name}", card.set_value)
+                self._all_cards.append(card)
+                grid.addWidget(card)
+            results_layout.addLayout(grid)
 
         results_layout.addStretch()
         layout.addWidget(results_frame, 1)
 
-        # Warnings frame
-        self.warnings_frame = QFrame()
-        self.warnings_frame.setObjectName("warningsFrame")
-        self.warnings_frame.setMaximumHeight(50)
-        warnings_layout = QHBoxLayout(self.warnings_frame)
-        warnings_layout.setContentsMargins(15, 10, 15, 10)
-        self.warnings_label = QLabel()
-        self.warnings_label.setWordWrap(True)
-        self.warnings_label.setStyleSheet("font-size: 12px;")
-        warnings_layout.addWidget(self.warnings_label)
-        self.warnings_frame.hide()
-        layout.addWidget(self.warnings_frame)
-
-        # Create label references for compatibility
-        self.d30_label = self.d30_card.value_label
-        self.d50_label = self.d50_card.value_label
-        self.d100_label = self.d100_card.value_label
-        self.mass_d30_label = self.mass_d30_card.value_label
-        self.mass_d50_label = self.mass_d50_card.value_label
-        self.mass_d100_label = self.mass_d100_card.value_label
-        self.thickness_label = self.thickness_card.value_label
-        self.class_label = self.class_card.value_label
-        self.froude_label = self.froude_card.value_label
-        self.mass_m2_label = self.mass_m2_card.value_label
+        # Warnings frame: construit au premier avertissement (_ensure_warnings_frame)
+        self.warnings_frame = None
+        self.warnings_label = None
+        self._warn_state = None
+        self._warn_text = None
+
+    def showEvent(self, event):
+        """Apply the last update deferred while hidden"""
+        super().showEvent(event)
+        if self._pending is not None:
+            method, arg = self._pending
+            method(arg)
 
     def update_results(self, result: MaynordResult):
         """Update the panel with calculation results"""
-        # Status
-        if result.froude_number > 1.2:
-            self.set_status("warning", "⚠️ LIMITE")
-        elif result.d100 > 1500:
-            self.set_status("warning", "⚠️ GROS BLOCS")
-        else:
-            self.set_status("stable", "✅ STABLE")
-
-        # Diameters
-        self.d30_card.set_value(f"{result.d30:.1f}")
-        self.d50_card.set_value(f"{result.d50:.1f}")
-        self.d100_card.set_value(f"{result.d100:.1f}")
-
-        # Masses
-        self.mass_d30_card.set_value(*self._format_mass(result.mass_d30))
-        self.mass_d50_card.set_value(*self._format_mass(result.mass_d50))
-        self.mass_d100_card.set_value(*self._format_mass(result.mass_d100))
-
-        # Other
-        self.thickness_card.set_value(f"{result.thickness:.1f}")
-        self.froude_card.set_value(f"{result.froude_number:.3f}")
-
-        # Gradation class
-        summary = get_complete_gradation_summary(result.d30, result.coefficients.get('Ss', 2.65))
-        self.class_card.set_value(summary.usace_class)
-        self.mass_m2_card.set_value(f"{summary.mass_per_m2:.0f}")
-
-        # Warnings
-        if result.warnings:
-            self.warnings_label.setText("⚠️ " + " | ".join(result.warnings))
-            self.warnings_frame.setStyleSheet("""
-                QFrame#warningsFrame {
-                    background: #fef3c7;
-                    border: 1px solid #f59e0b;
-                    border-radius: 6px;
-                }
-            """)
-            self.warnings_label.setStyleSheet("color: #92400e; font-size: 12px;")
-            self.warnings_frame.show()
-        else:
-            self.warnings_frame.hide()
-
-    def _format_mass(self, mass_kg: float) -> tuple:
-        """Format mass with appropriate unit, returns (value, unit)"""
+        if not self.isVisible():
+            self._pending = (self.update_results, result)
+            return
+        self._pending = None
+        self._cleared = False
+
+        # Meme resultat que l'affichage courant (ex: slider sans effet): rien a faire
+        key = (result.d30, result.d50, result.d100,
+               result.mass_d30, result.mass_d50, result.mass_d100,
+               result.thickness, result.froude_number,
+               tuple(result.warnings or ()))
+        if key == self._last_result_key:
+            return
+        self._last_result_key = key
+
+        with self._batch_updates():
+            # Status
+            if result.froude_number > 1.2:
+                self.set_status("warning", "⚠️ LIMITE")
+            elif result.d100 > 1500:
+                self.set_status("warning", "⚠️ GROS BLOCS")
+            else:
+                self.set_status("stable", "✅ STABLE")
+
+            # Diameters
+            self._set_d30(self._fmt1(result.d30))
+            self._set_d50(self._fmt1(result.d50))
+            self._set_d100(self._fmt1(result.d100))
+
+            # Masses
+            self._set_mass(self._set_mass_d30, result.mass_d30)
+            self._set_mass(self._set_mass_d50, result.mass_d50)
+            self._set_mass(self._set_mass_d100, result.mass_d100)
+
+            # Other
+            self._set_thickness(self._fmt1(result.thickness))
+            self._set_froude(self._fmt3(result.froude_number))
+
+            # Gradation class
+            summary = _gradation_cached(int(result.d30 * 100 + 0.5),
+                                        int(result.coefficients.get('Ss', 2.65) * 1000 + 0.5))
+            self._set_class(summary.usace_class)
+            self._set_mass_m2(_format_fixed(summary.mass_per_m2, 0))
+
+            # Warnings
+            if result.warnings:
+                self._show_warning("warn", "⚠️ " + " | ".join(result.warnings))
+            else:
+                self._hide_warning()
+
+    @contextmanager
+    def _batch_updates(self):
+        """Suspend repaints while many cards are set, one repaint at the end (nestable)"""
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+                self.update()
+
+    @staticmethod
+    def _fmt1(value: float) -> str:
+        return _format_fixed(value, 1)
+
+    @staticmethod
+    def _fmt3(value: float) -> str:
+        return _format_fixed(value, 3)
+
+    @staticmethod
+    def _set_mass(set_value, mass_kg: float):
+        """Display a mass through a card setter with the appropriate unit (t above 1000 kg)"""
         if mass_kg >= 1000:
-            return (f"{mass_kg/1000:.2f}", "t")
+            set_value(_format_fixed(mass_kg * 0.001, 2), "t")
         else:
-            return (f"{mass_kg:.1f}", "kg")
+            set_value(_format_fixed(mass_kg, 1), "kg")
 
     def set_status(self, status: str, text: str):
         """Set the status indicator"""
-        if status == "stable":
-            self.status_frame.setStyleSheet("""
-                QFrame {
-                    background: #dcfce7;
-                    border: 2px solid #16a34a;
-                    border-radius: 8px;
-                }
-            """)
-            self.status_icon.setStyleSheet("font-size: 18px; color: #16a34a;")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #16a34a;")
-        elif status == "warning":
-            self.status_frame.setStyleSheet("""
-                QFrame {
-                    background: #fef3c7;
-                    border: 2px solid #f59e0b;
-                    border-radius: 8px;
-                }
-            """)
-            self.status_icon.setStyleSheet("font-size: 18px; color: #f59e0b;")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #d97706;")
-        elif status == "error":
-            self.status_frame.setStyleSheet("""
-                QFrame {
-                    background: #fee2e2;
-                    border: 2px solid #dc2626;
-                    border-radius: 8px;
-                }
-            """)
-            self.status_icon.setStyleSheet("font-size: 18px; color: #dc2626;")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #dc2626;")
-        else:  # waiting
-            self.status_frame.setStyleSheet("""
-                QFrame {
-                    background: #f1f5f9;
-                    border: 2px solid #cbd5e1;
-                    border-radius: 8px;
-                }
-            """)
-            self.status_icon.setStyleSheet("font-size: 18px; color: #94a3b8;")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #64748b;")
+        if status != self._current_status:
+            frame_ss, icon_ss, label_ss = self._STATUS_STYLES.get(
+                status, self._STATUS_STYLES["waiting"])
+            self.status_frame.setStyleSheet(frame_ss)
+            self.status_icon.setStyleSheet(icon_ss)
+            self.status_label.setStyleSheet(label_ss)
+            self._current_status = status
 
         self.status_label.setText(text)
 
+    def _ensure_warnings_frame(self):
+        """Build the warnings frame on first use"""
+        if self.warnings_frame is None:
+            self.warnings_frame = QFrame()
+            self.warnings_frame.setObjectName("warningsFrame")
+            self.warnings_frame.setMaximumHeight(50)
+            warnings_layout = QHBoxLayout(self.warnings_frame)
+            warnings_layout.setContentsMargins(15, 10, 15, 10)
+            self.warnings_label = QLabel()
+            self.warnings_label.setWordWrap(True)
+            warnings_layout.addWidget(self.warnings_label)
+            self.layout().addWidget(self.warnings_frame)
+        return self.warnings_frame
+
+    def _show_warning(self, state: str, text: str):
+        """Show the warnings frame, restyling it only when the state ("warn"/"error") changes"""
+        frame = self._ensure_warnings_frame()
+        if state != self._warn_state:
+            if state == "error":
+                frame.setStyleSheet(self._ERROR_FRAME_CSS)
+                self.warnings_label.setStyleSheet(self._ERROR_LABEL_CSS)
+            else:
+                frame.setStyleSheet(self._WARN_FRAME_CSS)
+                self.warnings_label.setStyleSheet(self._WARN_LABEL_CSS)
+            self._warn_state = state
+        if text != self._warn_text:
+            self.warnings_label.setText(text)
+            self._warn_text = text
+        frame.show()
+
+    def _hide_warning(self):
+        """Hide the warnings frame if it was ever built"""
+        if self.warnings_frame is not None:
+            self.warnings_frame.hide()
+
     def show_error(self, message: str):
         """Show error message"""
+        if not self.isVisible():
+            self._pending = (self.show_error, message)
+            return
+        self._pending = None
+        self._cleared = False
+        self._last_result_key = None
         self.set_status("error", "❌ ERREUR")
-        self.warnings_label.setText(f"❌ {message}")
-        self.warnings_frame.setStyleSheet("""
-            QFrame#warningsFrame {
-                background: #fee2e2;
-                border: 1px solid #dc2626;
-                border-radius: 6px;
-            }
-        """)
-        self.warnings_label.setStyleSheet("color: #dc2626; font-size: 12px;")
-        self.warnings_frame.show()
+        self._show_warning("error", f"❌ {message}")
 
     def clear(self):
-        """Clear all results"""
-        self.set_status("waiting", "En attente...")
-
-        for card in [self.d30_card, self.d50_card, self.d100_card,
-                     self.mass_d30_card, self.mass_d50_card, self.mass_d100_card,
-                     self.thickness_card, self.class_card, self.froude_card, self.mass_m2_card]:
-            card.set_value("--")
-
-        self.warnings_frame.hide()
+        """Clear all results
+
+        The reset is applied on the next event-loop turn, so a clear() directly
+        followed by update_results()/show_error() never paints the "--" state.
+        """
+        self._pending = None
+        self._last_result_key = None
+        if not self._cleared:
+            self._cleared = True
+            QTimer.singleShot(0, self, self._apply_clear)
+
+    def _apply_clear(self):
+        """Reset the cards and status, unless a newer update superseded the clear"""
+        if not self._cleared:
+            return
+        self._cleared = False
+        with self._batch_updates():
+            self.set_status("waiting", "En attente...")
+
+            for card in self._all_cards:
+                card.set_value("--")
+
+            self._hide_warning()